@@ -1,46 +1,35 @@
+import time
+
+_T0 = time.perf_counter()
+
 import streamlit as st
 
-from core.analytics import ScenarioConfig, compute_scenario
-from core.consumption import SeasonalConsumptionParams
+from core.analytics import ScenarioConfig
 from core.inflation import DEFAULT_INFLATION_PERCENT
 from ui.theming import inject_global_css
 from ui.sidebar import render_sidebar
 from ui.cards import render_kpi_row
-from ui.charts import render_main_charts
-from ui.tables import render_monthly_table
+from utils.session_state import get_incremental_scenario
+from utils.startup import HEAVY_MODULES, StartupProfile, preload_in_background
+
+# ui.charts, ui.tables, ui.comparison, ui.montecarlo, ui.diagnostics y
+# ui.history (plotly/pandas) se importan dentro de main(), después del primer
+# contenido visible.
 
 
 def main():
+    # pandas y plotly se cargan en segundo plano mientras se pinta la cabecera
+    preload_in_background(HEAVY_MODULES)
+
     st.set_page_config(
         page_title="Planificador Inteligente de Presupuesto Estacional",
         layout="wide",
     )
+    profile = StartupProfile.from_env(_T0, st.query_params)
 
     inject_global_css()
 
-    # Sidebar → parámetros de simulación
-    params, inflation_array, k, method = render_sidebar()
-
-    # Configuración de escenario (capa core)
-    scenario_config = ScenarioConfig(
-        consumption=params,
-        inflation_percent=(
-            inflation_array
-            if inflation_array is not None
-            else DEFAULT_INFLATION_PERCENT
-        ),
-        inflation_factor=k,
-        method=method,  # "Simpson" | "Trapecios" | "Rectángulos"
-    )
-
-    # Cálculos
-    results = compute_scenario(scenario_config)
-    metrics = results["metrics"]
-    df_tiempo = results["df_tiempo"]
-    df_mensual = results["df_mensual"]
-
-    # Layout principal
-    # Layout principal
+    # Layout principal (primero: es lo que el usuario ve mientras carga el resto)
     st.title("📊 Planificador Inteligente de Presupuesto Estacional")
     st.markdown(
         """
@@ -72,18 +61,65 @@ def main():
             """
         )
 
+    profile.mark("Primer contenido visible")
+
+    # Sidebar → parámetros de simulación
+    params, inflation_array, k, method = render_sidebar()
+    profile.mark("Panel lateral")
+
+    # Configuración de escenario (capa core)
+    scenario_config = ScenarioConfig(
+        consumption=params,
+        inflation_percent=(
+            inflation_array
+            if inflation_array is not None
+            else DEFAULT_INFLATION_PERCENT
+        ),
+        inflation_factor=k,
+        method=method,  # "Simpson" | "Trapecios" | "Rectángulos"
+    )
+
+    # Cálculos: al editar la tabla de inflación solo se recalculan los meses tocados
+    results = get_incremental_scenario(scenario_config).results()
+    metrics = results["metrics"]
+    df_tiempo = results["df_tiempo"]
+    df_mensual = results["df_mensual"]
+    profile.mark("Cálculo del escenario")
+
     # KPIs
     render_kpi_row(metrics)
 
     st.markdown("---")
 
     # Gráficos principales
-    render_main_charts(df_tiempo)
+    with profile.stage("import ui.charts"):
+        from ui.charts import render_main_charts
+    render_main_charts(df_tiempo, results["result_hash"])
+    profile.mark("Gráficos principales")
 
     st.markdown("---")
 
     # Tabla mensual
-    render_monthly_table(df_mensual)
+    with profile.stage("import ui.tables"):
+        from ui.tables import render_monthly_table
+    render_monthly_table(df_mensual, results["result_hash"])
+
+    st.markdown("---")
+
+    # Comparación de escenarios (un solo cálculo en lote)
+    with profile.stage("import ui.comparison"):
+        from ui.comparison import render_scenario_comparison
+    render_scenario_comparison(
+        params,
+        scenario_config.inflation_percent,
+        scenario_config.method,
+        scenario_config.inflation_factor,
+    )
+
+    # Monte Carlo en segundo plano (no bloquea la página)
+    with profile.stage("import ui.montecarlo"):
+        from ui.montecarlo import render_monte_carlo
+    render_monte_carlo(scenario_config)
 
     # Descarga
     st.subheader("Descargar series completas")
@@ -95,11 +131,23 @@ def main():
         mime="text/csv",
     )
 
+    with profile.stage("import ui.diagnostics"):
+        from ui.diagnostics import render_integration_report
+    render_integration_report(scenario_config)
+
+    # Historial persistente (SQLite): la sesión guarda a pedido y ve solo lo suyo
+    with profile.stage("import ui.history"):
+        from ui.history import render_run_history
+    render_run_history(scenario_config, results)
+
     st.caption(
         "Esta herramienta es una aproximación educativa al gasto real anual con inflación y "
         "consumo estacional. No reemplaza asesoría financiera profesional."
     )
 
+    profile.mark("Página completa")
+    profile.render()
+
 
 if __name__ == "__main__":
     main()
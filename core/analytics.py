@@ -1,34 +1,117 @@
+import hashlib
 from dataclasses import dataclass
-from typing import Literal, Dict, Any
+from typing import Literal, Dict, Any, Optional, Sequence
 
 import numpy as np
-import pandas as pd
 
 from .consumption import SeasonalConsumptionParams, seasonal_consumption
 from .inflation import (
+    InflationScenarioConfig,
     scale_inflation,
     monthly_percent_to_log_rate,
     piecewise_pi_t,
     MONTH_LABELS,
 )
-from .deflator import build_deflator
+from .deflator import build_deflator, build_deflator_piecewise
 from .integration import (
+    INTEGRATORS,
     integrate_rectangles,
-    integrate_trapezoidal,
-    integrate_simpson,
+    cumulative_trapezoid,
 )
 
 IntegrationMethod = Literal["Simpson", "Trapecios", "Rectángulos"]
+Precision = Literal["float64", "float32"]
+
+# Tipo con el que se guardan las series (S, N) según la política de precisión.
+# Las integrales se acumulan siempre en float64 (ver core.integration).
+PRECISION_DTYPES = {"float64": np.float64, "float32": np.float32}
+
+# Primer mes de la serie de ejemplo (MONTH_LABELS arranca en Sep-24)
+DEFAULT_START_DATE = "2024-09-01"
+
+_MONTH_ABBR = [
+    "Ene", "Feb", "Mar", "Abr", "May", "Jun",
+    "Jul", "Ago", "Sep", "Oct", "Nov", "Dic",
+]  # fmt: skip
 
 
 @dataclass
 class ScenarioConfig:
-    """Configuración completa de un escenario de simulación."""
+    """
+    Configuración completa de un escenario de simulación.
+
+    precision="float32" guarda π(t), D(t), c(t)·D(t) y las curvas acumuladas en
+    float32 (la mitad de memoria en lotes grandes y Monte Carlo). Las sumas de
+    las integrales corren en float64, así que frente a precision="float64"
+    G_nom y G_real difieren en menos de 1e-6 relativo, y las series en menos
+    de 1e-6 relativo punto a punto. delta = G_nom - G_real se cancela cuando la
+    inflación es baja: su cota es 1e-6 · G_nom, no 1e-6 de su propio valor.
+    """
 
     consumption: SeasonalConsumptionParams
     inflation_percent: np.ndarray  # 12 valores en %
     inflation_factor: float  # κ
     method: IntegrationMethod  # método numérico
+    precision: Precision = "float64"  # tipo de almacenamiento de las series
+
+
+def storage_dtype(precision: str) -> np.dtype:
+    """Tipo NumPy de las series para una política de precisión."""
+    try:
+        return np.dtype(PRECISION_DTYPES[precision])
+    except KeyError:
+        raise ValueError(f"Precisión desconocida: {precision!r}.") from None
+
+
+def scenario_record_dtype(precision: str = "float64") -> np.dtype:
+    """
+    Registro compacto por escenario o trayectoria: totales y métricas en
+    float64, tablas mensuales (inflación, gasto por mes y acumulado en los 13
+    bordes de mes) en el tipo de almacenamiento.
+    """
+    store = storage_dtype(precision)
+    return np.dtype(
+        [
+            ("G_nom", np.float64),
+            ("G_real", np.float64),
+            ("delta", np.float64),
+            ("inflation_avg_pct", np.float64),
+            ("inflation_accum_pct", np.float64),
+            ("inflation_pct", store, (12,)),
+            ("G_nom_mes", store, (12,)),
+            ("G_real_mes", store, (12,)),
+            ("G_real_acum_mes", store, (13,)),
+        ]
+    )
+
+
+def batch_to_records(batch: Dict[str, Any]) -> np.ndarray:
+    """
+    Empaca el resultado de evaluate_batch (o de compute_scenario, como un lote
+    de uno) en un arreglo estructurado (S,) de scenario_record_dtype, sin las
+    series (S, N) de la malla.
+    """
+    metrics = batch["metrics"]
+    records = np.empty(
+        np.size(metrics["G_nom"]), dtype=scenario_record_dtype(batch["precision"])
+    )
+    for key in metrics:
+        records[key] = metrics[key]
+    records["inflation_pct"] = batch["inflation_scaled"]
+    records["G_nom_mes"] = batch["G_nom_mes"]
+    records["G_real_mes"] = batch["G_real_mes"]
+    records["G_real_acum_mes"] = batch["G_real_acum_mes"]
+    return records
+
+
+def hash_result_arrays(*arrays: np.ndarray) -> str:
+    """Hash corto y estable del contenido de varios arreglos (clave de caché)."""
+    h = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(f"{arr.dtype.str}{arr.shape}".encode("ascii"))
+        h.update(arr.tobytes())
+    return h.hexdigest()
 
 
 def build_time_grid(num_steps: int = 600):
@@ -37,63 +120,169 @@ def build_time_grid(num_steps: int = 600):
     return t, dt
 
 
-def compute_scenario(config: ScenarioConfig) -> Dict[str, Any]:
-    """Ejecuta todos los cálculos del escenario y devuelve resultados y series."""
+def build_calendar_grid(
+    start_date: str = DEFAULT_START_DATE, num_months: int = 12
+) -> Dict[str, np.ndarray]:
+    """
+    Malla diaria sobre fechas reales: un nodo por día, desde el primer día del mes
+    de start_date hasta el primer día del mes siguiente al último (incluido).
+
+    t se mide en meses: el día d de un mes de n días cae en t = m + (d - 1)/n, así
+    que cada mes sigue ocupando [m, m+1] pero con pasos de 1/28 a 1/31 (malla no
+    uniforme). Devuelve también el mes de cada nodo y los días de cada mes.
+    """
+    if num_months < 1:
+        raise ValueError("El horizonte debe tener al menos un mes.")
+    first_month = np.datetime64(start_date, "M")
+    month_starts = (first_month + np.arange(num_months + 1)).astype("datetime64[D]")
+    days_in_month = np.diff(month_starts).astype(int)
+
+    dates = np.arange(
+        month_starts[0],
+        month_starts[-1] + np.timedelta64(1, "D"),
+        dtype="datetime64[D]",
+    )
+    # El nodo final (inicio del mes siguiente) cierra el último mes: t - m = 1
+    month_index = np.append(
+        np.repeat(np.arange(num_months), days_in_month), num_months - 1
+    )
+    day_offset = (dates - month_starts[month_index]).astype(int)
+    t = month_index + day_offset / days_in_month[month_index]
+
+    return {
+        "dates": dates,
+        "t": t,
+        "dt": np.diff(t),
+        "month_index": month_index,
+        "month_starts": month_starts[:-1],
+        "days_in_month": days_in_month,
+    }
+
+
+def calendar_month_labels(month_starts: np.ndarray) -> list:
+    """Etiquetas tipo MONTH_LABELS ("Sep-24") para fechas de inicio de mes."""
+    months = month_starts.astype("datetime64[M]").astype(int)  # meses desde 1970-01
+    return [f"{_MONTH_ABBR[m % 12]}-{(1970 + m // 12) % 100:02d}" for m in months]
+
+
+def evaluate_integrand(config: ScenarioConfig, num_steps: int = 600) -> Dict[str, Any]:
+    """Evalúa c(t), π(t), D(t) y el integrando c(t)·D(t) sobre la malla uniforme."""
     # Escalar inflación (%)
     inflation_scaled = scale_inflation(
         config.inflation_percent,
-        # usamos un dataclass-like simple
-        type("Tmp", (), {"factor": config.inflation_factor})(),
+        InflationScenarioConfig(factor=config.inflation_factor),
     )
+    store = storage_dtype(config.precision)
     # Malla temporal
-    t, dt = build_time_grid(num_steps=600)
+    t, dt = build_time_grid(num_steps=num_steps)
 
     # Consumo nominal
-    c_t = seasonal_consumption(t, config.consumption)
+    c_t = seasonal_consumption(t, config.consumption).astype(store, copy=False)
 
     # π(t) y deflactor
     pi_monthly = monthly_percent_to_log_rate(inflation_scaled)
-    pi_t = piecewise_pi_t(pi_monthly, t)
+    pi_t = piecewise_pi_t(pi_monthly, t, dtype=store)
     D_t = build_deflator(pi_t, dt)
     f_t = c_t * D_t  # integrando: consumo real
 
+    return {
+        "t": t,
+        "dt": dt,
+        "c_t": c_t,
+        "pi_t": pi_t,
+        "D_t": D_t,
+        "f_t": f_t,
+        "pi_monthly": pi_monthly,
+        "inflation_scaled": inflation_scaled,
+    }
+
+
+def monthly_breakdown(
+    t: np.ndarray,
+    dt: float,
+    c_t: np.ndarray,
+    D_t: np.ndarray,
+    f_t: np.ndarray,
+    integrate,
+    consumption: SeasonalConsumptionParams,
+) -> Dict[str, np.ndarray]:
+    """
+    Resumen por mes a partir de la malla principal:
+    - c_mid / real_mid: consumo en el punto medio de cada mes (estimación puntual),
+    - G_nom_mes / G_real_mes: gasto integrado en cada mes con el mismo integrador
+      de los KPIs, así que su suma coincide con G_nom / G_real.
+    La malla debe tener un número de pasos múltiplo de 12.
+    """
+    num_steps = len(t) - 1
+    if num_steps % 12 != 0:
+        raise ValueError("La malla debe tener un número de pasos múltiplo de 12.")
+    steps_per_month = num_steps // 12
+
+    t_mid = np.arange(12) + 0.5
+    c_mid = seasonal_consumption(t_mid, consumption)
+    D_mid = np.interp(t_mid, t, D_t)  # exacto si el punto medio es nodo
+
+    # (12, pasos_por_mes + 1): cada fila es un mes, compartiendo los bordes
+    idx = np.arange(12)[:, None] * steps_per_month + np.arange(steps_per_month + 1)
+
+    return {
+        "c_mid": c_mid,
+        "real_mid": c_mid * D_mid,
+        "G_nom_mes": integrate(c_t[idx], dt),
+        "G_real_mes": integrate(f_t[idx], dt),
+    }
+
+
+def compute_scenario(config: ScenarioConfig) -> Dict[str, Any]:
+    """Ejecuta todos los cálculos del escenario y devuelve resultados y series."""
+    grid = evaluate_integrand(config, num_steps=600)
+    t, dt = grid["t"], grid["dt"]
+    c_t, D_t, f_t = grid["c_t"], grid["D_t"], grid["f_t"]
+
     # Método numérico
-    if config.method == "Simpson":
-        integrate = integrate_simpson
-    elif config.method == "Trapecios":
-        integrate = integrate_trapezoidal
-    else:
-        integrate = integrate_rectangles
+    integrate = INTEGRATORS.get(config.method, integrate_rectangles)
 
     G_nom = integrate(c_t, dt)
     G_real = integrate(f_t, dt)
-    delta = G_nom - G_real
 
     # Gasto real acumulado (para curva)
-    G_real_acum = np.zeros_like(f_t)
-    for k in range(1, len(f_t)):
-        G_real_acum[k] = G_real_acum[k - 1] + 0.5 * (f_t[k - 1] + f_t[k]) * dt
+    G_real_acum = cumulative_trapezoid(f_t, dt)
+
+    # Resumen mensual desde la malla principal (sin segunda pasada)
+    monthly = monthly_breakdown(t, dt, c_t, D_t, f_t, integrate, config.consumption)
 
-    # Resumen mensual (aproximación en puntos medios)
-    meses = np.arange(12)
-    t_mid = meses + 0.5
-    c_mid = seasonal_consumption(t_mid, config.consumption)
-    pi_mid = piecewise_pi_t(pi_monthly, t_mid)
+    return scenario_results(config, grid, G_nom, G_real, G_real_acum, monthly)
 
-    # deflactor en 12 meses: malla refinada
-    t12, dt12 = np.linspace(0.0, 12.0, 12 * 10 + 1, retstep=True)
-    pi12 = piecewise_pi_t(pi_monthly, t12)
-    D12 = build_deflator(pi12, dt12)
-    D_mid = np.interp(t_mid, t12, D12)
 
-    real_mid = c_mid * D_mid
+def scenario_results(
+    config: ScenarioConfig,
+    grid: Dict[str, Any],
+    G_nom: float,
+    G_real: float,
+    G_real_acum: np.ndarray,
+    monthly: Dict[str, np.ndarray],
+) -> Dict[str, Any]:
+    """
+    Arma el diccionario de resultados de un escenario (tablas, métricas y hash)
+    a partir de la malla de evaluate_integrand, los totales, la curva acumulada
+    y el resumen de monthly_breakdown.
+    """
+    import pandas as pd  # diferido: importar core no debe cargar pandas
+
+    t, dt = grid["t"], grid["dt"]
+    c_t, pi_t, D_t, f_t = grid["c_t"], grid["pi_t"], grid["D_t"], grid["f_t"]
+    pi_monthly = grid["pi_monthly"]
+    inflation_scaled = grid["inflation_scaled"]
+    delta = G_nom - G_real
 
     df_mensual = pd.DataFrame(
         {
             "Mes": MONTH_LABELS,
             "Inflación mensual (%)": np.round(inflation_scaled, 3),
-            "Consumo nominal estimado (COP)": np.round(c_mid, 0),
-            "Consumo real estimado (COP)": np.round(real_mid, 0),
+            "Consumo nominal estimado (COP)": np.round(monthly["c_mid"], 0),
+            "Consumo real estimado (COP)": np.round(monthly["real_mid"], 0),
+            "Gasto nominal del mes (COP)": np.round(monthly["G_nom_mes"], 0),
+            "Gasto real del mes (COP)": np.round(monthly["G_real_mes"], 0),
         }
     )
 
@@ -121,6 +310,11 @@ def compute_scenario(config: ScenarioConfig) -> Dict[str, Any]:
         "inflation_accum_pct": inflation_accum_pct,
     }
 
+    # Identifica el resultado (no la configuración): sirve de clave de caché
+    result_hash = hash_result_arrays(
+        t, c_t, pi_t, f_t, G_real_acum, inflation_scaled, *monthly.values()
+    )
+
     return {
         "t": t,
         "dt": dt,
@@ -133,4 +327,255 @@ def compute_scenario(config: ScenarioConfig) -> Dict[str, Any]:
         "df_tiempo": df_tiempo,
         "metrics": metrics,
         "inflation_scaled": inflation_scaled,
+        "precision": config.precision,
+        "G_nom_mes": monthly["G_nom_mes"],
+        "G_real_mes": monthly["G_real_mes"],
+        "G_real_acum_mes": G_real_acum[:: (len(t) - 1) // 12],
+        "result_hash": result_hash,
+    }
+
+
+def evaluate_batch(
+    params: SeasonalConsumptionParams,
+    inflation_scaled: np.ndarray,
+    methods,
+    num_steps: int = 600,
+    precision: Precision = "float64",
+) -> Dict[str, Any]:
+    """
+    Motor en lote a nivel de arreglos: params con α, β, γ de forma (S, 1) (o
+    escalares), inflation_scaled (S, 12) en % ya escalada por κ, y methods como
+    un método para todas las filas o una secuencia de S métodos.
+
+    Devuelve series (S, N) en el tipo de `precision`, métricas (S,) en float64,
+    gasto integrado por mes (S, 12) y el acumulado en los bordes de mes (S, 13).
+    """
+    store = storage_dtype(precision)
+    inflation_scaled = np.atleast_2d(np.asarray(inflation_scaled, dtype=float))
+    n_scen = inflation_scaled.shape[0]
+    if isinstance(methods, str):
+        methods = [methods] * n_scen
+    methods = np.array(methods, dtype=object)
+
+    t, dt = build_time_grid(num_steps=num_steps)
+    c_t = np.broadcast_to(
+        seasonal_consumption(t, params).astype(store, copy=False), (n_scen, len(t))
+    )
+
+    pi_monthly = monthly_percent_to_log_rate(inflation_scaled)
+    pi_t = piecewise_pi_t(pi_monthly, t, dtype=store)
+    D_t = build_deflator(pi_t, dt)
+    f_t = c_t * D_t
+
+    # Cada fila de idx es un mes de la malla (comparten bordes)
+    steps_per_month = num_steps // 12
+    idx = np.arange(12)[:, None] * steps_per_month + np.arange(steps_per_month + 1)
+
+    # Un único llamado por método distinto (a lo sumo tres), cada uno sobre
+    # todas las filas que lo usan.
+    G_nom = np.empty(n_scen)
+    G_real = np.empty(n_scen)
+    G_nom_mes = np.full((n_scen, 12), np.nan)
+    G_real_mes = np.full((n_scen, 12), np.nan)
+    for method in dict.fromkeys(methods):
+        rows = methods == method
+        if rows.all():
+            rows = slice(None)  # evita copiar (S, N) cuando hay un solo método
+        integrate = INTEGRATORS.get(method, integrate_rectangles)
+        G_nom[rows] = integrate(c_t[rows], dt)
+        G_real[rows] = integrate(f_t[rows], dt)
+        if num_steps % 12 == 0:
+            G_nom_mes[rows] = integrate(c_t[rows][:, idx], dt)
+            G_real_mes[rows] = integrate(f_t[rows][:, idx], dt)
+
+    G_real_acum = cumulative_trapezoid(f_t, dt)
+    if num_steps % 12 == 0:
+        G_real_acum_mes = G_real_acum[:, ::steps_per_month]
+    else:
+        G_real_acum_mes = np.full((n_scen, 13), np.nan)
+
+    inflation_accum_log = np.sum(pi_monthly, axis=-1)
+    metrics = {
+        "G_nom": G_nom,
+        "G_real": G_real,
+        "delta": G_nom - G_real,
+        "inflation_avg_pct": np.mean(inflation_scaled, axis=-1),
+        "inflation_accum_pct": (np.exp(inflation_accum_log) - 1.0) * 100.0,
+    }
+
+    return {
+        "methods": list(methods),
+        "precision": precision,
+        "t": t,
+        "dt": dt,
+        "c_t": c_t,
+        "pi_t": pi_t,
+        "D_t": D_t,
+        "f_t": f_t,
+        "G_real_acum": G_real_acum,
+        "G_real_acum_mes": G_real_acum_mes,
+        "G_nom_mes": G_nom_mes,
+        "G_real_mes": G_real_mes,
+        "metrics": metrics,
+        "inflation_scaled": inflation_scaled,
+    }
+
+
+def stack_configs(configs: Sequence[ScenarioConfig]) -> Dict[str, Any]:
+    """
+    Apila S configs para el motor en lote: params con α, β, γ de forma (S, 1),
+    κ (S,), inflación escalada (S, 12), métodos y la precisión común (float32
+    solo si todas las configs la piden).
+    """
+    if len(configs) == 0:
+        raise ValueError("Se necesita al menos un escenario para comparar.")
+    # Parámetros apilados: (S, 1) para que difundan contra la malla (N,)
+    params = SeasonalConsumptionParams(
+        alpha=np.array([c.consumption.alpha for c in configs], dtype=float)[:, None],
+        beta=np.array([c.consumption.beta for c in configs], dtype=float)[:, None],
+        gamma=np.array([c.consumption.gamma for c in configs], dtype=float)[:, None],
+    )
+    kappa = np.array([c.inflation_factor for c in configs], dtype=float)
+    inflation_percent = np.stack(
+        [np.asarray(c.inflation_percent, dtype=float) for c in configs]
+    )
+    precision = (
+        "float32" if all(c.precision == "float32" for c in configs) else "float64"
+    )
+    return {
+        "params": params,
+        "kappa": kappa,
+        "inflation_scaled": inflation_percent * kappa[:, None],
+        "methods": [c.method for c in configs],
+        "precision": precision,
+    }
+
+
+def compute_scenarios_batch(
+    configs: Sequence[ScenarioConfig],
+    labels: Optional[Sequence[str]] = None,
+    num_steps: int = 600,
+) -> Dict[str, Any]:
+    """
+    Evalúa S escenarios en una sola pasada vectorizada sobre la malla compartida.
+
+    Cada escenario puede tener su propio consumo, tabla de inflación, κ y método.
+    Las series salen como arreglos (S, N) y las métricas como arreglos (S,);
+    no se construye ningún DataFrame por escenario. Las series van en float32
+    solo si todos los escenarios lo piden.
+    """
+    if labels is None:
+        labels = [f"Escenario {i + 1}" for i in range(len(configs))]
+    if len(labels) != len(configs):
+        raise ValueError("Debe haber una etiqueta por escenario.")
+
+    stacked = stack_configs(configs)
+    result = evaluate_batch(
+        stacked["params"],
+        stacked["inflation_scaled"],
+        stacked["methods"],
+        num_steps=num_steps,
+        precision=stacked["precision"],
+    )
+    result["labels"] = list(labels)
+    result["kappa"] = stacked["kappa"]
+    return result
+
+
+def compute_calendar_scenario(
+    config: ScenarioConfig,
+    start_date: str = DEFAULT_START_DATE,
+    years: int = 1,
+) -> Dict[str, Any]:
+    """
+    Igual que compute_scenario, pero sobre una malla diaria de fechas reales
+    (meses de 28 a 31 días) y un horizonte de varios años.
+
+    config.inflation_percent puede traer 12 valores (se repiten cada año) o
+    12·years valores. La inflación de cada mes rige desde su primer día y el
+    deflactor se evalúa en forma exacta sobre la malla.
+    """
+    import pandas as pd  # diferido: importar core no debe cargar pandas
+
+    num_months = 12 * years
+    inflation_scaled = scale_inflation(
+        config.inflation_percent,
+        InflationScenarioConfig(factor=config.inflation_factor),
+    )
+    if inflation_scaled.shape[-1] == 12 and years > 1:
+        inflation_scaled = np.tile(inflation_scaled, years)
+    if inflation_scaled.shape[-1] != num_months:
+        raise ValueError(
+            f"Se esperaban 12 o {num_months} valores de inflación mensual."
+        )
+
+    grid = build_calendar_grid(start_date, num_months)
+    t, dt, month_index = grid["t"], grid["dt"], grid["month_index"]
+    days_in_month = grid["days_in_month"]
+
+    store = storage_dtype(config.precision)
+    c_t = seasonal_consumption(t, config.consumption).astype(store, copy=False)
+    pi_monthly = monthly_percent_to_log_rate(inflation_scaled)
+    pi_t = pi_monthly[month_index].astype(store, copy=False)
+    D_t = build_deflator_piecewise(pi_monthly, t, month_index).astype(store, copy=False)
+    f_t = c_t * D_t
+
+    # Totales por mes calendario con el método elegido, cada mes por separado
+    # (el integrando tiene un quiebre en cada cambio de tasa); los totales son
+    # su suma, así que la tabla mensual cuadra con G_nom y G_real
+    integrate = INTEGRATORS.get(config.method, integrate_rectangles)
+    month_start_idx = np.concatenate(([0], np.cumsum(days_in_month)))
+    bounds = list(zip(month_start_idx[:-1], month_start_idx[1:]))
+    G_nom_mes = np.array([integrate(c_t[a : b + 1], dt[a:b]) for a, b in bounds])
+    G_real_mes = np.array([integrate(f_t[a : b + 1], dt[a:b]) for a, b in bounds])
+    G_nom = float(np.sum(G_nom_mes))
+    G_real = float(np.sum(G_real_mes))
+
+    G_real_acum = cumulative_trapezoid(f_t, dt)
+    days_node = days_in_month[month_index]
+
+    df_diario = pd.DataFrame(
+        {
+            "Fecha": grid["dates"],
+            "t_mes": t,
+            "Consumo nominal diario (COP/día)": c_t / days_node,
+            "π(t) (mes^-1)": pi_t,
+            "Deflactor D(t)": D_t,
+            "Consumo real diario (COP/día)": f_t / days_node,
+            "Gasto real acumulado (COP)": G_real_acum,
+        }
+    )
+
+    df_mensual = pd.DataFrame(
+        {
+            "Mes": calendar_month_labels(grid["month_starts"]),
+            "Días": days_in_month,
+            "Inflación mensual (%)": np.round(inflation_scaled, 3),
+            "Gasto nominal del mes (COP)": np.round(G_nom_mes, 0),
+            "Gasto real del mes (COP)": np.round(G_real_mes, 0),
+        }
+    )
+
+    inflation_accum_log = float(np.sum(pi_monthly))
+    metrics = {
+        "G_nom": G_nom,
+        "G_real": G_real,
+        "delta": G_nom - G_real,
+        "inflation_avg_pct": float(np.mean(inflation_scaled)),
+        "inflation_accum_pct": (np.exp(inflation_accum_log) - 1.0) * 100.0,
+    }
+
+    return {
+        "dates": grid["dates"],
+        "t": t,
+        "dt": dt,
+        "c_t": c_t,
+        "pi_t": pi_t,
+        "D_t": D_t,
+        "f_t": f_t,
+        "G_real_acum": G_real_acum,
+        "df_mensual": df_mensual,
+        "df_diario": df_diario,
+        "metrics": metrics,
+        "inflation_scaled": inflation_scaled,
     }
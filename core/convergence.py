@@ -0,0 +1,148 @@
+"""
+Convergencia y costo de los métodos de integración.
+
+Compara Simpson, Trapecios y Rectángulos contra la integral exacta del modelo
+(ver core.exact) para distintas mallas, y elige el método/paso más barato que
+cumple una tolerancia dada.
+
+Uso por consola:
+    python -m core.convergence --tol 1e-4
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .analytics import ScenarioConfig, evaluate_integrand
+from .consumption import SeasonalConsumptionParams
+from .exact import monthly_exact_integrals
+from .inflation import (
+    DEFAULT_INFLATION_PERCENT,
+    InflationScenarioConfig,
+    monthly_percent_to_log_rate,
+    scale_inflation,
+)
+from .integration import INTEGRATORS
+
+# Múltiplos de 12 → los saltos de π(t) caen sobre nodos de la malla
+DEFAULT_GRID_SIZES = (12, 24, 48, 96, 192, 384, 600, 768, 1536, 3072)
+
+
+def exact_spend(config: ScenarioConfig) -> Dict[str, float]:
+    """Gasto nominal y real anual exactos (forma cerrada por mes)."""
+    inflation_scaled = scale_inflation(
+        config.inflation_percent,
+        InflationScenarioConfig(factor=config.inflation_factor),
+    )
+    pi_monthly = monthly_percent_to_log_rate(inflation_scaled)
+    nominal, real = monthly_exact_integrals(config.consumption, pi_monthly)
+    return {"G_nom": float(np.sum(nominal)), "G_real": float(np.sum(real))}
+
+
+def real_spend_on_grid(config: ScenarioConfig, num_steps: int, method: str) -> float:
+    """G_real con el pipeline completo (malla, deflactor, integrador)."""
+    grid = evaluate_integrand(config, num_steps=num_steps)
+    return INTEGRATORS[method](grid["f_t"], grid["dt"])
+
+
+def integration_convergence_report(
+    config: ScenarioConfig,
+    grid_sizes: Sequence[int] = DEFAULT_GRID_SIZES,
+    methods: Sequence[str] = tuple(INTEGRATORS),
+    repeats: int = 5,
+    number: int = 20,
+) -> pd.DataFrame:
+    """
+    Error frente a la integral exacta y tiempo por evaluación, por método y malla.
+    El tiempo es el mínimo de `repeats` mediciones de `number` llamadas e incluye
+    construir la malla y el deflactor, no solo la suma del integrador.
+    """
+    reference = exact_spend(config)["G_real"]
+    rows = []
+    for method in methods:
+        for n in grid_sizes:
+            value = real_spend_on_grid(config, n, method)
+            timings = timeit.repeat(
+                lambda: real_spend_on_grid(config, n, method),
+                repeat=repeats,
+                number=number,
+            )
+            err = abs(value - reference)
+            rows.append(
+                {
+                    "Método": method,
+                    "Pasos": int(n),
+                    "G_real (COP)": value,
+                    "Error absoluto (COP)": err,
+                    "Error relativo": err / abs(reference),
+                    "Tiempo (ms)": min(timings) / number * 1e3,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def choose_method_for_tolerance(
+    report: pd.DataFrame, tol: float
+) -> Optional[Dict[str, Any]]:
+    """Fila más barata del reporte cuyo error relativo es ≤ tol (None si ninguna)."""
+    ok = report[report["Error relativo"] <= tol]
+    if ok.empty:
+        return None
+    return ok.sort_values(["Tiempo (ms)", "Pasos"]).iloc[0].to_dict()
+
+
+def identical_methods(report: pd.DataFrame):
+    """Pares de métodos cuyo G_real coincide (a precisión de máquina) en toda malla."""
+    values = report.pivot(index="Pasos", columns="Método", values="G_real (COP)")
+    names = list(dict.fromkeys(report["Método"]))
+    pairs = []
+    for i, a in enumerate(names):
+        for b in names[i + 1 :]:
+            if np.allclose(values[a], values[b], rtol=1e-12, atol=0.0):
+                pairs.append((a, b))
+    return pairs
+
+
+def _default_config() -> ScenarioConfig:
+    return ScenarioConfig(
+        consumption=SeasonalConsumptionParams(
+            alpha=1_500_000, beta=150_000, gamma=75_000
+        ),
+        inflation_percent=DEFAULT_INFLATION_PERCENT,
+        inflation_factor=1.0,
+        method="Simpson",
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tol", type=float, default=1e-4, help="error relativo")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    report = integration_convergence_report(_default_config(), repeats=args.repeats)
+    with pd.option_context("display.width", 120, "display.max_rows", None):
+        print(report.to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+
+    for a, b in identical_methods(report):
+        print(
+            f"\nNota: {a} y {b} dan exactamente el mismo resultado "
+            "en todas las mallas."
+        )
+
+    best = choose_method_for_tolerance(report, args.tol)
+    if best is None:
+        print(f"\nNingún método alcanza error relativo ≤ {args.tol:g}.")
+    else:
+        print(
+            f"\nMás barato con error relativo ≤ {args.tol:g}: "
+            f"{best['Método']} con {best['Pasos']} pasos "
+            f"({best['Tiempo (ms)']:.3f} ms, error {best['Error relativo']:.2e})."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,109 @@
 import numpy as np
 
+from .integration import cumulative_trapezoid
+
 
 def build_deflator(pi_t: np.ndarray, dt: float) -> np.ndarray:
     """
     Construye el deflactor continuo D(t) ≈ exp(-∫ π(s) ds)
     usando integración por trapecios sobre la malla uniforme.
+    Acepta lotes (S, N): integra sobre el último eje.
+    """
+    return np.exp(-cumulative_trapezoid(pi_t, dt))
+
+
+def monthly_log_deflator(pi_monthly: np.ndarray) -> np.ndarray:
+    """
+    Log-deflactor acumulado al inicio de cada mes: L_m = Σ_{j<m} π_j.
+    Para M tasas devuelve M+1 valores (incluye el cierre del periodo).
+    Acepta lotes (S, M).
+    """
+    pi_monthly = np.asarray(pi_monthly, dtype=float)
+    L = np.zeros(pi_monthly.shape[:-1] + (pi_monthly.shape[-1] + 1,))
+    np.cumsum(pi_monthly, axis=-1, out=L[..., 1:])
+    return L
+
+
+def build_deflator_piecewise(
+    pi_monthly: np.ndarray, t: np.ndarray, month_index: np.ndarray
+) -> np.ndarray:
+    """
+    Deflactor exacto para π(t) pieza-constante por mes, en cualquier malla:
+    D(t) = exp(-(L_m + π_m · (t - m))), con m = month_index (la inflación del mes
+    rige desde su primer día). t en meses; acepta lotes (S, M) de tasas.
+    """
+    L = monthly_log_deflator(pi_monthly)
+    pi_monthly = np.asarray(pi_monthly, dtype=float)
+    return np.exp(
+        -(L[..., month_index] + pi_monthly[..., month_index] * (t - month_index))
+    )
+
+
+class IncrementalDeflator:
     """
-    integral_pi = np.zeros_like(pi_t)
-    for k in range(1, len(pi_t)):
-        integral_pi[k] = integral_pi[k - 1] + 0.5 * (pi_t[k - 1] + pi_t[k]) * dt
-    return np.exp(-integral_pi)
+    Deflactor por trapecios de π(t) pieza-constante (el mismo de build_deflator
+    sobre la malla uniforme) guardado por meses: L_m es el log-deflactor en el
+    primer nodo del mes m y, dentro del mes, el nodo k vale L_m + k·π_m·dt.
+
+    Cambiar la tasa de un mes solo recalcula los L de los meses siguientes
+    (O(meses)); los valores por nodo se generan al pedirlos. El número de pasos
+    debe ser múltiplo de 12.
+    """
+
+    def __init__(self, pi_monthly: np.ndarray, num_steps: int = 600):
+        if num_steps % 12 != 0:
+            raise ValueError("La malla debe tener un número de pasos múltiplo de 12.")
+        pi_monthly = np.array(pi_monthly, dtype=float)
+        if pi_monthly.shape != (12,):
+            raise ValueError("Se esperaban 12 valores de inflación mensual.")
+        self.num_steps = num_steps
+        self.steps_per_month = num_steps // 12
+        self.t = np.linspace(0.0, 12.0, num_steps + 1)
+        self.dt = self.t[1] - self.t[0]
+        self.pi_monthly = pi_monthly
+        # L_0..L_11 al inicio de cada mes y L_12 en el nodo final (t = 12)
+        self.month_log = np.zeros(13)
+        self._refresh_from(0)
+
+    def _refresh_from(self, m: int) -> None:
+        pi, dt, spm = self.pi_monthly, self.dt, self.steps_per_month
+        for k in range(m, 11):
+            # pasos internos del mes k y el paso que cruza al mes k+1
+            self.month_log[k + 1] = (
+                self.month_log[k]
+                + (spm - 1) * pi[k] * dt
+                + 0.5 * (pi[k] + pi[k + 1]) * dt
+            )
+        # el nodo t = 12 pertenece al último mes
+        self.month_log[12] = self.month_log[11] + spm * pi[11] * dt
+
+    def set_rate(self, m: int, pi: float) -> float:
+        """
+        Cambia la tasa logarítmica del mes m. Devuelve el desplazamiento del
+        log-deflactor para todos los nodos desde el inicio del mes m+1 (los
+        meses siguientes se reescalan por exp(-desplazamiento)).
+        """
+        before = self.month_log[min(m + 1, 12)]
+        self.pi_monthly[m] = float(pi)
+        self._refresh_from(max(m - 1, 0))
+        return self.month_log[min(m + 1, 12)] - before
+
+    def month_log_deflator(self, m: int) -> np.ndarray:
+        """Log-deflactor en los spm+1 nodos del mes m (incluye el borde derecho)."""
+        spm = self.steps_per_month
+        out = self.month_log[m] + np.arange(spm + 1) * (self.pi_monthly[m] * self.dt)
+        out[-1] = self.month_log[m + 1]
+        return out
+
+    def log_deflator(self) -> np.ndarray:
+        """Log-deflactor ∫π en todos los nodos de la malla (N+1,)."""
+        spm = self.steps_per_month
+        k = np.arange(self.num_steps + 1)
+        month = np.minimum(k // spm, 11)
+        return self.month_log[month] + (k - month * spm) * (
+            self.pi_monthly[month] * self.dt
+        )
+
+    def deflator(self) -> np.ndarray:
+        """D(t) en todos los nodos de la malla."""
+        return np.exp(-self.log_deflator())
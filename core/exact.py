@@ -0,0 +1,45 @@
+import numpy as np
+from typing import Tuple
+
+from .consumption import SeasonalConsumptionParams, OMEGA
+from .deflator import monthly_log_deflator
+
+
+def _expint_unit(z):
+    """
+    E(z) = ∫₀¹ e^{-z s} ds = (1 - e^{-z}) / z, con E(0) = 1.
+    Acepta z real o complejo (arreglos).
+    """
+    z = np.asarray(z)
+    if np.iscomplexobj(z):
+        # Para z = p - iω, |z| ≥ ω > 0: no hay cancelación.
+        return (1.0 - np.exp(-z)) / z
+    safe = np.where(z == 0.0, 1.0, z)
+    return np.where(z == 0.0, 1.0, -np.expm1(-safe) / safe)
+
+
+def monthly_exact_integrals(
+    params: SeasonalConsumptionParams, pi_monthly: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integrales exactas por mes del gasto nominal ∫ c(t) dt y real ∫ c(t) D(t) dt.
+
+    Con π(t) = π_m constante en [m, m+1): D(t) = e^{-L_m} e^{-π_m (t - m)}, y
+    β cos(ωt) + γ sin(ωt) = Re[(β - iγ) e^{iωt}], así que cada mes se integra
+    en forma cerrada. Devuelve dos arreglos (..., 12).
+    """
+    pi_monthly = np.asarray(pi_monthly, dtype=float)
+    m = np.arange(pi_monthly.shape[-1])
+    alpha = np.asarray(params.alpha, dtype=float)
+    amp = np.asarray(params.beta, dtype=float) - 1j * np.asarray(
+        params.gamma, dtype=float
+    )
+    phase = amp * np.exp(1j * OMEGA * m)
+
+    nominal = alpha + np.real(phase * _expint_unit(-1j * OMEGA))
+    L = monthly_log_deflator(pi_monthly)[..., :-1]
+    real = np.exp(-L) * (
+        alpha * _expint_unit(pi_monthly)
+        + np.real(phase * _expint_unit(pi_monthly - 1j * OMEGA))
+    )
+    return nominal, real
@@ -1,6 +1,9 @@
 import numpy as np
-import pandas as pd
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 MONTH_LABELS = [
     "Sep-24",
@@ -34,8 +37,10 @@ class InflationScenarioConfig:
     factor: float = 1.0
 
 
-def get_default_inflation_dataframe() -> pd.DataFrame:
+def get_default_inflation_dataframe() -> "pd.DataFrame":
     """Devuelve DataFrame de inflación mensual de ejemplo."""
+    import pandas as pd  # diferido: importar core no debe cargar pandas
+
     return pd.DataFrame(
         {
             "Mes": MONTH_LABELS,
@@ -62,13 +67,15 @@ def monthly_percent_to_log_rate(monthly_percent: np.ndarray) -> np.ndarray:
     return np.log1p(p)
 
 
-def piecewise_pi_t(pi_monthly: np.ndarray, t: np.ndarray) -> np.ndarray:
+def piecewise_pi_t(pi_monthly: np.ndarray, t: np.ndarray, dtype=float) -> np.ndarray:
     """
     Construye función pieza-constante π(t) a partir de 12 tasas logarítmicas π_m.
-    t se asume en meses en [0, 12].
+    t se asume en meses en [0, 12]. Si pi_monthly es un lote (S, 12),
+    devuelve (S, len(t)) con el tipo dtype (float32 en el modo compacto).
     """
-    if len(pi_monthly) != 12:
+    pi_monthly = np.asarray(pi_monthly, dtype=dtype)
+    if pi_monthly.shape[-1] != 12:
         raise ValueError("Se esperaban 12 valores de inflación mensual.")
     t_clipped = np.clip(t, 0.0, 11.9999)
     month_index = np.floor(t_clipped).astype(int)  # 0..11
-    return pi_monthly[month_index]
+    return pi_monthly[..., month_index]
@@ -1,41 +1,178 @@
 import numpy as np
+from typing import Union
 
+IntegralResult = Union[float, np.ndarray]
+# Paso de la malla: escalar (malla uniforme) o arreglo de N-1 pasos (no uniforme)
+Spacing = Union[float, np.ndarray]
 
-def integrate_rectangles(f: np.ndarray, dt: float) -> float:
+# Las sumas de las reglas se acumulan siempre en float64, aunque f venga en
+# float32 (modo compacto): así los totales en COP no pierden precisión.
+ACCUMULATOR_DTYPE = np.float64
+_CUMSUM_BLOCK_ROWS = 1024
+
+
+def _as_result(value) -> IntegralResult:
+    """Devuelve float para entradas 1D y arreglo para lotes (una fila por escenario)."""
+    value = np.asarray(value)
+    return float(value) if value.ndim == 0 else value
+
+
+def _is_uniform(dt: Spacing) -> bool:
+    return np.ndim(dt) == 0
+
+
+def integrate_rectangles(f: np.ndarray, dt: Spacing) -> IntegralResult:
     """
     Regla de rectángulos (puntos medios aproximados con promedio de extremos).
+    Integra sobre el último eje, así que acepta lotes de forma (S, N).
+    dt puede ser escalar o el arreglo de N-1 pasos de una malla no uniforme.
     """
-    mid_values = 0.5 * (f[:-1] + f[1:])
-    return float(np.sum(mid_values) * dt)
+    mid_values = 0.5 * (f[..., :-1] + f[..., 1:])
+    if not _is_uniform(dt):
+        return _as_result(np.sum(mid_values * dt, axis=-1, dtype=ACCUMULATOR_DTYPE))
+    return _as_result(np.sum(mid_values, axis=-1, dtype=ACCUMULATOR_DTYPE) * dt)
 
 
-def integrate_trapezoidal(f: np.ndarray, dt: float) -> float:
+def integrate_trapezoidal(f: np.ndarray, dt: Spacing) -> IntegralResult:
     """
-    Regla del trapecio compuesta.
+    Regla del trapecio compuesta (sobre el último eje).
     """
-    return float((f[0] + 2.0 * np.sum(f[1:-1]) + f[-1]) * dt / 2.0)
+    if not _is_uniform(dt):
+        return _as_result(
+            np.sum(
+                0.5 * (f[..., :-1] + f[..., 1:]) * dt, axis=-1, dtype=ACCUMULATOR_DTYPE
+            )
+        )
+    return _as_result(
+        (
+            f[..., 0].astype(ACCUMULATOR_DTYPE)
+            + 2.0 * np.sum(f[..., 1:-1], axis=-1, dtype=ACCUMULATOR_DTYPE)
+            + f[..., -1]
+        )
+        * dt
+        / 2.0
+    )
 
 
-def integrate_simpson(f: np.ndarray, dt: float) -> float:
+def integrate_simpson(f: np.ndarray, dt: Spacing) -> IntegralResult:
     """
-    Regla de Simpson compuesta.
+    Regla de Simpson compuesta (sobre el último eje).
     Si el número de subintervalos es impar, se usa Simpson hasta el penúltimo
     y trapecio en el último.
     """
-    n = len(f) - 1  # subintervalos
+    n = f.shape[-1] - 1  # subintervalos
     if n < 2:
-        return 0.0
+        return _as_result(np.zeros(f.shape[:-1]))
+    if not _is_uniform(dt):
+        return _as_result(_simpson_nonuniform(f, np.asarray(dt, dtype=float)))
     if n % 2 == 1:
         n_simpson = n - 1
-        f_s = f[: n_simpson + 1]
+        f_s = f[..., : n_simpson + 1]
         res_s = (
-            (f_s[0] + 2.0 * np.sum(f_s[2:-1:2]) + 4.0 * np.sum(f_s[1::2]) + f_s[-1])
+            (
+                f_s[..., 0].astype(ACCUMULATOR_DTYPE)
+                + 2.0 * np.sum(f_s[..., 2:-1:2], axis=-1, dtype=ACCUMULATOR_DTYPE)
+                + 4.0 * np.sum(f_s[..., 1::2], axis=-1, dtype=ACCUMULATOR_DTYPE)
+                + f_s[..., -1]
+            )
             * dt
             / 3.0
         )
-        res_t = (f[n_simpson] + f[n_simpson + 1]) * dt / 2.0
-        return float(res_s + res_t)
+        res_t = (
+            (f[..., n_simpson].astype(ACCUMULATOR_DTYPE) + f[..., n_simpson + 1])
+            * dt
+            / 2.0
+        )
+        return _as_result(res_s + res_t)
     else:
-        return float(
-            (f[0] + 2.0 * np.sum(f[2:-1:2]) + 4.0 * np.sum(f[1::2]) + f[-1]) * dt / 3.0
+        return _as_result(
+            (
+                f[..., 0].astype(ACCUMULATOR_DTYPE)
+                + 2.0 * np.sum(f[..., 2:-1:2], axis=-1, dtype=ACCUMULATOR_DTYPE)
+                + 4.0 * np.sum(f[..., 1::2], axis=-1, dtype=ACCUMULATOR_DTYPE)
+                + f[..., -1]
+            )
+            * dt
+            / 3.0
         )
+
+
+def _simpson_nonuniform(f: np.ndarray, dt: np.ndarray) -> np.ndarray:
+    """
+    Simpson compuesta para pasos variables, por pares de intervalos (h0, h1):
+    (h0+h1)/6 · [(2 - h1/h0) f0 + (h0+h1)²/(h0 h1) f1 + (2 - h0/h1) f2].
+    Con número impar de intervalos, el último se integra por trapecio.
+    """
+    n = f.shape[-1] - 1
+    n_simpson = n - (n % 2)
+    h0 = dt[0:n_simpson:2]
+    h1 = dt[1:n_simpson:2]
+    hs = h0 + h1
+    f0 = f[..., 0:n_simpson:2]
+    f1 = f[..., 1:n_simpson:2]
+    f2 = f[..., 2 : n_simpson + 1 : 2]
+    res = np.sum(
+        hs
+        / 6.0
+        * ((2.0 - h1 / h0) * f0 + hs * hs / (h0 * h1) * f1 + (2.0 - h0 / h1) * f2),
+        axis=-1,
+        dtype=ACCUMULATOR_DTYPE,
+    )
+    if n % 2 == 1:
+        res = res + 0.5 * (f[..., -2].astype(ACCUMULATOR_DTYPE) + f[..., -1]) * dt[-1]
+    return res
+
+
+def cumulative_trapezoid(f: np.ndarray, dt: Spacing) -> np.ndarray:
+    """
+    Integral acumulada por trapecios sobre el último eje, empezando en 0.
+    Misma forma que f (sirve para curvas acumuladas y para el deflactor).
+    Si f es float32 el resultado también lo es, pero la suma corre en float64
+    para que el error no crezca con N.
+    """
+    increments = 0.5 * (f[..., :-1] + f[..., 1:]) * dt
+    if f.dtype == np.float32:
+        out = np.zeros(f.shape, dtype=np.float32)
+        # Por bloques de filas: el temporal float64 no depende del tamaño del lote
+        rows_in = increments.reshape(-1, increments.shape[-1])
+        rows_out = out.reshape(-1, f.shape[-1])
+        for start in range(0, rows_in.shape[0], _CUMSUM_BLOCK_ROWS):
+            block = slice(start, start + _CUMSUM_BLOCK_ROWS)
+            rows_out[block, 1:] = np.cumsum(
+                rows_in[block], axis=-1, dtype=ACCUMULATOR_DTYPE
+            )
+        return out
+    out = np.zeros_like(f, dtype=float)
+    np.cumsum(increments, axis=-1, out=out[..., 1:])
+    return out
+
+
+def quadrature_weights(method: str, num_steps: int, dt: float) -> np.ndarray:
+    """
+    Pesos w (num_steps + 1,) tales que Σ w_j f_j reproduce el integrador del
+    método sobre la malla uniforme (Rectángulos y Trapecios comparten pesos).
+    """
+    n = num_steps
+    w = np.zeros(n + 1)
+    if method == "Simpson":
+        if n < 2:
+            return w
+        n_simpson = n - (n % 2)
+        w[0 : n_simpson + 1 : 2] = 2.0
+        w[1:n_simpson:2] = 4.0
+        w[0] = w[n_simpson] = 1.0
+        w *= dt / 3.0
+        if n % 2 == 1:  # último intervalo por trapecio
+            w[n - 1] += dt / 2.0
+            w[n] = dt / 2.0
+        return w
+    w[:] = dt
+    w[0] = w[-1] = dt / 2.0
+    return w
+
+
+INTEGRATORS = {
+    "Simpson": integrate_simpson,
+    "Trapecios": integrate_trapezoidal,
+    "Rectángulos": integrate_rectangles,
+}
@@ -0,0 +1,415 @@
+"""
+Kernel fusionado consumo × deflactor × integración.
+
+El motor en lote (evaluate_batch) hace varias pasadas sobre la malla (c(t),
+π(t), el cumsum del deflactor, exp, c·D y las sumas de cada integrador), y
+cada una crea arreglos (S, N) temporales. Cuando solo se necesitan métricas
+(G_nom, G_real, gasto por mes y la curva acumulada), este módulo las calcula
+recorriendo la malla una sola vez por escenario:
+
+- con Numba (opcional, `pip install numba`): un bucle compilado, en paralelo
+  sobre escenarios, sin arreglos (S, N);
+- sin Numba: NumPy por bloques de filas, con operaciones en sitio y las
+  integrales como productos matriz·pesos.
+
+Los resultados coinciden con evaluate_batch salvo el orden de las sumas
+(diferencias relativas del orden de 1e-15).
+
+Uso por consola (benchmark contra el camino actual):
+    python -m core.kernels --scenarios 1 100 10000
+"""
+
+import argparse
+import os
+import timeit
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .analytics import (
+    Precision,
+    ScenarioConfig,
+    build_time_grid,
+    evaluate_batch,
+    stack_configs,
+    storage_dtype,
+)
+from .consumption import OMEGA, SeasonalConsumptionParams
+from .inflation import DEFAULT_INFLATION_PERCENT, monthly_percent_to_log_rate
+from .integration import quadrature_weights
+
+try:
+    import numba
+except ImportError:  # Numba es opcional
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+# Filas por bloque en el camino NumPy: los temporales caben en caché
+_NUMPY_BLOCK_ROWS = 256
+
+
+# ---------------------------------------------------------------------------
+# Camino Numba
+# ---------------------------------------------------------------------------
+
+if HAVE_NUMBA:
+
+    @numba.njit(parallel=True, cache=True, nogil=True)
+    def _fused_numba(
+        alpha,
+        beta,
+        gamma,
+        pi_monthly,
+        cos_t,
+        sin_t,
+        month_index,
+        weights,
+        month_weights,
+        dt,
+        g_nom,
+        g_real,
+        g_nom_mes,
+        g_real_mes,
+        acum_mes,
+        curve,
+    ):
+        n_scen = pi_monthly.shape[0]
+        n = weights.shape[0] - 1
+        spm = month_weights.shape[0] - 1
+        with_curve = curve.shape[1] > 0
+        for s in numba.prange(n_scen):
+            log_d = 0.0
+            acum = 0.0
+            pi_prev = 0.0
+            f_prev = 0.0
+            nom = 0.0
+            real = 0.0
+            for j in range(n + 1):
+                c = alpha[s] + beta[s] * cos_t[j] + gamma[s] * sin_t[j]
+                pi = pi_monthly[s, month_index[j]]
+                if j > 0:
+                    log_d += 0.5 * (pi_prev + pi) * dt
+                f = c * np.exp(-log_d)
+                if j > 0:
+                    acum += 0.5 * (f_prev + f) * dt
+                nom += weights[j] * c
+                real += weights[j] * f
+                # Gasto por mes: el nodo k del mes m, y el borde cierra el anterior
+                if spm > 0:
+                    month, k = j // spm, j % spm
+                    if month < 12:
+                        g_nom_mes[s, month] += month_weights[k] * c
+                        g_real_mes[s, month] += month_weights[k] * f
+                    if k == 0:
+                        acum_mes[s, month] = acum
+                        if month > 0:
+                            g_nom_mes[s, month - 1] += month_weights[spm] * c
+                            g_real_mes[s, month - 1] += month_weights[spm] * f
+                if with_curve:
+                    curve[s, j] = acum
+                pi_prev = pi
+                f_prev = f
+            g_nom[s] = nom
+            g_real[s] = real
+
+
+def _grid_tables(num_steps: int):
+    """cos ωt, sin ωt y el mes de cada nodo: comunes a todos los escenarios."""
+    t, _ = build_time_grid(num_steps=num_steps)
+    month_index = np.floor(np.clip(t, 0.0, 11.9999)).astype(np.int64)
+    return np.cos(OMEGA * t), np.sin(OMEGA * t), month_index
+
+
+def _run_numba(alpha, beta, gamma, pi_monthly, weights, month_weights, dt, out):
+    _fused_numba(
+        alpha,
+        beta,
+        gamma,
+        pi_monthly,
+        *_grid_tables(len(weights) - 1),
+        weights,
+        month_weights,
+        dt,
+        out["G_nom"],
+        out["G_real"],
+        out["G_nom_mes"],
+        out["G_real_mes"],
+        out["G_real_acum_mes"],
+        out["G_real_acum"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Camino NumPy
+# ---------------------------------------------------------------------------
+
+
+def _run_numpy(alpha, beta, gamma, pi_monthly, weights, month_weights, dt, out):
+    n = len(weights) - 1
+    spm = len(month_weights) - 1
+    cos_t, sin_t, month_index = _grid_tables(n)
+    with_curve = out["G_real_acum"].shape[1] > 0
+
+    n_scen = pi_monthly.shape[0]
+    rows = min(n_scen, _NUMPY_BLOCK_ROWS)
+    c = np.empty((rows, n + 1))
+    f = np.empty((rows, n + 1))
+    for start in range(0, n_scen, rows):
+        b = slice(start, min(start + rows, n_scen))
+        r = b.stop - b.start
+        cb, fb = c[:r], f[:r]
+
+        # c(t) = α + β cos ωt + γ sin ωt, en sitio
+        np.multiply(beta[b, None], cos_t, out=cb)
+        cb += alpha[b, None]
+        cb += gamma[b, None] * sin_t
+
+        # log D por trapecios sobre π(t), luego f = c · exp(-log D), en sitio
+        pi_t = pi_monthly[b][:, month_index]
+        fb[:, 0] = 0.0
+        np.add(pi_t[:, :-1], pi_t[:, 1:], out=fb[:, 1:])
+        fb[:, 1:] *= 0.5 * dt
+        np.cumsum(fb, axis=1, out=fb)
+        np.negative(fb, out=fb)
+        np.exp(fb, out=fb)
+        fb *= cb
+
+        out["G_nom"][b] = cb @ weights
+        out["G_real"][b] = fb @ weights
+        if spm > 0:
+            # Mes m = nodos [m·spm, (m+1)·spm]: bloque (r, 12, spm) + borde derecho
+            out["G_nom_mes"][b] = (
+                cb[:, :-1].reshape(r, 12, spm) @ month_weights[:-1]
+                + cb[:, spm::spm] * month_weights[-1]
+            )
+            out["G_real_mes"][b] = (
+                fb[:, :-1].reshape(r, 12, spm) @ month_weights[:-1]
+                + fb[:, spm::spm] * month_weights[-1]
+            )
+
+        # Curva acumulada del gasto real (reutiliza cb como temporal)
+        cb[:, 0] = 0.0
+        np.add(fb[:, :-1], fb[:, 1:], out=cb[:, 1:])
+        cb[:, 1:] *= 0.5 * dt
+        np.cumsum(cb, axis=1, out=cb)
+        if spm > 0:
+            out["G_real_acum_mes"][b] = cb[:, ::spm]
+        if with_curve:
+            out["G_real_acum"][b] = cb
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    "numba" si está instalado, si no "numpy". La variable de entorno
+    PRESUPUESTO_KERNEL fuerza uno de los dos.
+    """
+    backend = backend or os.environ.get("PRESUPUESTO_KERNEL") or "auto"
+    if backend == "auto":
+        return "numba" if HAVE_NUMBA else "numpy"
+    if backend not in ("numba", "numpy"):
+        raise ValueError(f"Backend desconocido: {backend!r}.")
+    if backend == "numba" and not HAVE_NUMBA:
+        raise ImportError("Numba no está instalado (pip install numba).")
+    return backend
+
+
+def fused_evaluate(
+    params: SeasonalConsumptionParams,
+    inflation_scaled: np.ndarray,
+    methods,
+    num_steps: int = 600,
+    precision: Precision = "float64",
+    curve: bool = False,
+    backend: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Igual que evaluate_batch, pero sin las series (S, N): devuelve métricas
+    (S,), gasto por mes (S, 12), el acumulado en los bordes de mes (S, 13) y,
+    con curve=True, la curva acumulada completa G_real_acum (S, N).
+    El resultado sirve para analytics.batch_to_records.
+    """
+    backend = resolve_backend(backend)
+    inflation_scaled = np.atleast_2d(np.asarray(inflation_scaled, dtype=float))
+    n_scen = inflation_scaled.shape[0]
+    if isinstance(methods, str):
+        methods = [methods] * n_scen
+    methods = np.array(methods, dtype=object)
+    store = storage_dtype(precision)
+
+    t, dt = build_time_grid(num_steps=num_steps)
+    spm = num_steps // 12 if num_steps % 12 == 0 else 0
+    coeffs = [
+        np.ascontiguousarray(
+            np.broadcast_to(np.asarray(x, dtype=float).reshape(-1), (n_scen,))
+        )
+        for x in (params.alpha, params.beta, params.gamma)
+    ]
+    pi_monthly = monthly_percent_to_log_rate(inflation_scaled)
+
+    out = {
+        "G_nom": np.empty(n_scen),
+        "G_real": np.empty(n_scen),
+        "G_nom_mes": np.zeros((n_scen, 12)),
+        "G_real_mes": np.zeros((n_scen, 12)),
+        "G_real_acum_mes": np.zeros((n_scen, 13)),
+        "G_real_acum": np.zeros((n_scen, len(t) if curve else 0), dtype=store),
+    }
+    run = _run_numba if backend == "numba" else _run_numpy
+    # Un llamado por método distinto (a lo sumo tres)
+    for method in dict.fromkeys(methods):
+        rows = np.flatnonzero(methods == method)
+        weights = quadrature_weights(method, num_steps, dt)
+        month_weights = quadrature_weights(method, spm, dt) if spm else np.zeros(1)
+        if len(rows) == n_scen:
+            run(*coeffs, pi_monthly, weights, month_weights, dt, out)
+            continue
+        part = {key: np.ascontiguousarray(arr[rows]) for key, arr in out.items()}
+        run(
+            *(x[rows] for x in coeffs),
+            np.ascontiguousarray(pi_monthly[rows]),
+            weights,
+            month_weights,
+            dt,
+            part,
+        )
+        for key, arr in part.items():
+            out[key][rows] = arr
+    if not spm:
+        for key in ("G_nom_mes", "G_real_mes", "G_real_acum_mes"):
+            out[key][:] = np.nan
+
+    inflation_accum_log = np.sum(pi_monthly, axis=-1)
+    result = {
+        "methods": list(methods),
+        "precision": precision,
+        "backend": backend,
+        "t": t,
+        "dt": dt,
+        "G_nom_mes": out["G_nom_mes"].astype(store, copy=False),
+        "G_real_mes": out["G_real_mes"].astype(store, copy=False),
+        "G_real_acum_mes": out["G_real_acum_mes"].astype(store, copy=False),
+        "metrics": {
+            "G_nom": out["G_nom"],
+            "G_real": out["G_real"],
+            "delta": out["G_nom"] - out["G_real"],
+            "inflation_avg_pct": np.mean(inflation_scaled, axis=-1),
+            "inflation_accum_pct": (np.exp(inflation_accum_log) - 1.0) * 100.0,
+        },
+        "inflation_scaled": inflation_scaled,
+    }
+    if curve:
+        result["G_real_acum"] = out["G_real_acum"]
+    return result
+
+
+def compute_scenarios_fused(
+    configs: Sequence[ScenarioConfig],
+    num_steps: int = 600,
+    curve: bool = False,
+    backend: Optional[str] = None,
+) -> Dict[str, Any]:
+    """compute_scenarios_batch sin series (S, N), con el kernel fusionado."""
+    stacked = stack_configs(configs)
+    result = fused_evaluate(
+        stacked["params"],
+        stacked["inflation_scaled"],
+        stacked["methods"],
+        num_steps=num_steps,
+        precision=stacked["precision"],
+        curve=curve,
+        backend=backend,
+    )
+    result["kappa"] = stacked["kappa"]
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+def benchmark(
+    scenario_counts: Sequence[int] = (1, 100, 10_000),
+    num_steps: int = 600,
+    method: str = "Simpson",
+    repeats: int = 5,
+) -> list:
+    """
+    Tiempo por llamado (mejor de `repeats`) de evaluate_batch frente al kernel
+    fusionado, y la mayor diferencia relativa de G_real entre ambos.
+    """
+    rng = np.random.default_rng(0)
+    backends = ["numpy"] + (["numba"] if HAVE_NUMBA else [])
+    rows = []
+    for n_scen in scenario_counts:
+        params = SeasonalConsumptionParams(
+            alpha=rng.uniform(1e6, 3e6, n_scen)[:, None],
+            beta=rng.uniform(0, 3e5, n_scen)[:, None],
+            gamma=rng.uniform(0, 1e5, n_scen)[:, None],
+        )
+        inflation = DEFAULT_INFLATION_PERCENT * rng.uniform(0.5, 1.5, (n_scen, 1))
+
+        def current():
+            return evaluate_batch(params, inflation, method, num_steps)
+
+        number = max(1, 2000 // n_scen)
+        ref = current()["metrics"]["G_real"]
+        base_ms = min(timeit.repeat(current, number=number, repeat=repeats))
+        base_ms *= 1e3 / number
+        rows.append(
+            {"Escenarios": n_scen, "Camino": "evaluate_batch", "Tiempo (ms)": base_ms}
+        )
+        for backend in backends:
+
+            def fused():
+                return fused_evaluate(
+                    params, inflation, method, num_steps, curve=True, backend=backend
+                )
+
+            got = fused()["metrics"]["G_real"]  # también compila (Numba)
+            ms = min(timeit.repeat(fused, number=number, repeat=repeats))
+            ms *= 1e3 / number
+            rows.append(
+                {
+                    "Escenarios": n_scen,
+                    "Camino": f"fusionado ({backend})",
+                    "Tiempo (ms)": ms,
+                    "Aceleración": base_ms / ms,
+                    "Dif. relativa máx.": float(np.max(np.abs(got / ref - 1.0))),
+                }
+            )
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del kernel fusionado.")
+    parser.add_argument("--scenarios", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--steps", type=int, default=600)
+    parser.add_argument("--method", default="Simpson")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if not HAVE_NUMBA:
+        print("Numba no está instalado: solo se mide el camino NumPy.\n")
+    rows = benchmark(args.scenarios, args.steps, args.method, args.repeats)
+    print(
+        f"{'Escenarios':>10}  {'Camino':<20}  {'Tiempo (ms)':>12}  "
+        f"{'Aceleración':>11}  {'Dif. relativa':>13}"
+    )
+    for r in rows:
+        speedup = f"{r['Aceleración']:.2f}×" if "Aceleración" in r else ""
+        diff = f"{r['Dif. relativa máx.']:.1e}" if "Dif. relativa máx." in r else ""
+        print(
+            f"{r['Escenarios']:>10}  {r['Camino']:<20}  {r['Tiempo (ms)']:>12.3f}  "
+            f"{speedup:>11}  {diff:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
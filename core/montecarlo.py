@@ -0,0 +1,157 @@
+"""
+Simulación Monte Carlo de trayectorias de inflación.
+
+Cada trayectoria toma la tabla mensual del escenario (ya escalada por κ) y le
+suma un ruido normal independiente por mes, en puntos porcentuales. Las
+trayectorias se evalúan por bloques con el kernel fusionado (core.kernels),
+que no guarda las series de la malla, así que la memoria queda acotada por
+chunk_size y no por n_paths. Lo que se guarda
+por trayectoria es un registro compacto (scenario_record_dtype); con
+config.precision="float32" sus tablas mensuales ocupan la mitad.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+from .analytics import ScenarioConfig, batch_to_records
+from .kernels import fused_evaluate
+from .inflation import InflationScenarioConfig, scale_inflation
+
+
+@dataclass
+class MonteCarloConfig:
+    """Parámetros de la simulación Monte Carlo."""
+
+    n_paths: int = 10_000
+    sigma_pct: float = 0.2  # desviación estándar por mes (puntos porcentuales)
+    seed: Optional[int] = None
+    chunk_size: int = 5_000
+
+
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+
+# Resúmenes parciales por simulación: cada uno recorre todo lo simulado hasta
+# ese momento, así que se acotan para que el costo total siga siendo lineal
+DEFAULT_MAX_SUMMARIES = 10
+
+
+def sample_inflation_paths(
+    base_percent: np.ndarray, n_paths: int, sigma_pct: float, rng: np.random.Generator
+) -> np.ndarray:
+    """Trayectorias (n_paths, 12) de inflación mensual en %."""
+    noise = rng.normal(0.0, sigma_pct, size=(n_paths, len(base_percent)))
+    return np.asarray(base_percent, dtype=float)[None, :] + noise
+
+
+def iter_monte_carlo_chunks(
+    config: ScenarioConfig, mc: MonteCarloConfig, num_steps: int = 600
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Genera los resultados bloque a bloque: los registros compactos de cada
+    trayectoria y, como vistas sobre ellos, sus métricas y el gasto real
+    acumulado en los 13 bordes de mes. Útil para mostrar bandas que convergen
+    mientras la simulación avanza.
+    """
+    rng = np.random.default_rng(mc.seed)
+    base = scale_inflation(
+        config.inflation_percent,
+        InflationScenarioConfig(factor=config.inflation_factor),
+    )
+    done = 0
+    while done < mc.n_paths:
+        n = min(mc.chunk_size, mc.n_paths - done)
+        paths = sample_inflation_paths(base, n, mc.sigma_pct, rng)
+        # Solo métricas: el kernel fusionado no crea las series (n, N)
+        batch = fused_evaluate(
+            config.consumption,
+            paths,
+            config.method,
+            num_steps,
+            precision=config.precision,
+        )
+        records = batch_to_records(batch)
+        yield {
+            "records": records,
+            "inflation_paths": records["inflation_pct"],
+            "G_nom": records["G_nom"],
+            "G_real": records["G_real"],
+            "delta": records["delta"],
+            "G_real_acum_mes": records["G_real_acum_mes"],
+        }
+        done += n
+
+
+def summarize_monte_carlo(
+    chunks: Sequence[Dict[str, np.ndarray]],
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> Dict[str, Any]:
+    """Une los bloques y calcula percentiles de las métricas y bandas por mes."""
+    records = np.concatenate([c["records"] for c in chunks])
+    return _summarize_records(records, percentiles)
+
+
+def _summarize_records(
+    records: np.ndarray, percentiles: Sequence[float]
+) -> Dict[str, Any]:
+    G_real = records["G_real"]
+    delta = records["delta"]
+    acum = records["G_real_acum_mes"]
+    q = np.asarray(percentiles, dtype=float)
+    return {
+        "n_paths": int(len(records)),
+        "records": records,
+        "percentiles": q,
+        "G_real": G_real,
+        "delta": delta,
+        "G_real_pct": np.percentile(G_real, q),
+        "delta_pct": np.percentile(delta, q),
+        "t_bands": np.arange(acum.shape[1], dtype=float),
+        "bands": np.percentile(acum, q, axis=0),  # (P, 13)
+        "G_real_mean": float(np.mean(G_real)),
+        "G_real_std": float(np.std(G_real)),
+    }
+
+
+def iter_monte_carlo_summaries(
+    config: ScenarioConfig,
+    mc: MonteCarloConfig,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    num_steps: int = 600,
+    max_summaries: int = DEFAULT_MAX_SUMMARIES,
+    on_chunk: Optional[Callable[[int], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Resúmenes parciales sobre las trayectorias simuladas hasta el momento: las
+    bandas convergen a medida que avanza la simulación. Los registros van a un
+    único arreglo reservado de antemano y cada resumen usa el tramo ya lleno;
+    se emiten a lo sumo max_summaries (el último es el mismo de
+    run_monte_carlo). on_chunk(n) se llama tras cada bloque con las
+    trayectorias hechas, por ejemplo para reportar avance o cancelar.
+    """
+    n_chunks = -(-mc.n_paths // mc.chunk_size)
+    every = max(1, -(-n_chunks // max(1, max_summaries)))
+    records = None
+    filled = 0
+    for i, chunk in enumerate(iter_monte_carlo_chunks(config, mc, num_steps), 1):
+        if records is None:
+            records = np.empty(mc.n_paths, dtype=chunk["records"].dtype)
+        n = len(chunk["records"])
+        records[filled : filled + n] = chunk["records"]
+        filled += n
+        if on_chunk is not None:
+            on_chunk(filled)
+        if i % every == 0 or filled == mc.n_paths:
+            yield _summarize_records(records[:filled], percentiles)
+
+
+def run_monte_carlo(
+    config: ScenarioConfig,
+    mc: MonteCarloConfig,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    num_steps: int = 600,
+) -> Dict[str, Any]:
+    """Ejecuta la simulación completa y devuelve el resumen."""
+    chunks = list(iter_monte_carlo_chunks(config, mc, num_steps))
+    return summarize_monte_carlo(chunks, percentiles)
@@ -0,0 +1,398 @@
+"""
+Almacén persistente de corridas (SQLite).
+
+Cada corrida guarda las entradas de un ScenarioConfig (α, β, γ, κ, método,
+precisión y la tabla de inflación, referenciada por su id) junto con sus
+métricas y el registro compacto de scenario_record_dtype. Sirve para:
+
+- consultar y recargar corridas pasadas sin recalcularlas (índices por α, κ,
+  método e id de la serie de inflación),
+- responder desde disco lo que el motor ya calculó, incluso tras reiniciar el
+  proceso (cached_scenario_records).
+
+Cada corrida tiene un dueño (owner): la app usa un id por sesión, así una
+sesión solo lista y carga las suyas; "" es el espacio compartido del servicio.
+Al guardar se borran las corridas más viejas que max_age y, dentro de cada
+dueño, las que pasen de max_runs: lo que el servicio cachea no desplaza lo que
+una sesión guardó.
+
+La base va en la carpeta de datos del usuario (fuera del código), salvo que la
+variable de entorno PRESUPUESTO_STORE indique otra ruta.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .analytics import ScenarioConfig, batch_to_records, scenario_record_dtype
+from .consumption import SeasonalConsumptionParams
+from .kernels import compute_scenarios_fused
+
+STORE_ENV_VAR = "PRESUPUESTO_STORE"
+
+
+def _data_dir() -> str:
+    """Carpeta de datos del usuario (XDG en Linux, LOCALAPPDATA en Windows)."""
+    base = (
+        os.environ.get("XDG_DATA_HOME")
+        or os.environ.get("LOCALAPPDATA")
+        or os.path.join(os.path.expanduser("~"), ".local", "share")
+    )
+    return os.path.join(base, "presupuesto_estacional")
+
+
+DEFAULT_STORE_PATH = os.path.join(_data_dir(), "runs.sqlite")
+
+# Retención por defecto: 30 días y a lo sumo 10.000 corridas
+DEFAULT_MAX_AGE = 30 * 24 * 3600.0
+DEFAULT_MAX_RUNS = 10_000
+
+# SQLite limita la cantidad de parámetros por consulta; se consulta por tramos
+_KEYS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inflation_series (
+    id TEXT PRIMARY KEY,
+    values_pct BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL DEFAULT '',
+    run_key TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    alpha REAL NOT NULL,
+    beta REAL NOT NULL,
+    gamma REAL NOT NULL,
+    kappa REAL NOT NULL,
+    method TEXT NOT NULL,
+    precision TEXT NOT NULL,
+    num_steps INTEGER NOT NULL,
+    series_id TEXT NOT NULL REFERENCES inflation_series(id),
+    G_nom REAL NOT NULL,
+    G_real REAL NOT NULL,
+    delta REAL NOT NULL,
+    record BLOB NOT NULL,
+    UNIQUE (owner, run_key)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_key ON runs(run_key);
+CREATE INDEX IF NOT EXISTS idx_runs_owner ON runs(owner, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_alpha ON runs(alpha);
+CREATE INDEX IF NOT EXISTS idx_runs_kappa ON runs(kappa);
+CREATE INDEX IF NOT EXISTS idx_runs_method ON runs(method);
+CREATE INDEX IF NOT EXISTS idx_runs_series ON runs(series_id);
+"""
+
+# Bases anteriores, sin columna owner (run_key era único): se copian a la tabla
+# nueva como corridas compartidas
+_MIGRATE_ADD_OWNER = (
+    """
+BEGIN;
+DROP INDEX IF EXISTS idx_runs_alpha;
+DROP INDEX IF EXISTS idx_runs_kappa;
+DROP INDEX IF EXISTS idx_runs_method;
+DROP INDEX IF EXISTS idx_runs_series;
+ALTER TABLE runs RENAME TO runs_old;
+"""
+    + _SCHEMA
+    + """
+INSERT INTO runs (owner, run_key, created_at, alpha, beta, gamma, kappa, method,
+    precision, num_steps, series_id, G_nom, G_real, delta, record)
+SELECT '', run_key, created_at, alpha, beta, gamma, kappa, method, precision,
+    num_steps, series_id, G_nom, G_real, delta, record FROM runs_old;
+DROP TABLE runs_old;
+COMMIT;
+"""
+)
+
+_RUN_COLUMNS = (
+    "id, created_at, alpha, beta, gamma, kappa, method, precision, num_steps, "
+    "series_id, G_nom, G_real, delta"
+)
+
+
+def inflation_series_id(inflation_percent: np.ndarray) -> str:
+    """Id estable de una tabla de inflación (12 valores en %, sin escalar)."""
+    values = np.ascontiguousarray(inflation_percent, dtype=np.float64)
+    return hashlib.blake2b(values.tobytes(), digest_size=8).hexdigest()
+
+
+def run_key(config: ScenarioConfig, num_steps: int = 600) -> str:
+    """Clave única de las entradas de una corrida (misma clave ⇒ mismo resultado)."""
+    c = config.consumption
+    h = hashlib.blake2b(digest_size=16)
+    h.update(
+        np.array(
+            [c.alpha, c.beta, c.gamma, config.inflation_factor], dtype=np.float64
+        ).tobytes()
+    )
+    h.update(f"{config.method}|{config.precision}|{num_steps}|".encode("utf-8"))
+    h.update(inflation_series_id(config.inflation_percent).encode("ascii"))
+    return h.hexdigest()
+
+
+class RunStore:
+    """
+    Conexión a la base de corridas. Se puede compartir entre hilos: cada
+    operación toma un lock y las escrituras en lote van en una sola transacción.
+    max_age (segundos) y max_runs (por dueño) acotan lo que se conserva; None
+    no limita.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+        max_runs: Optional[int] = DEFAULT_MAX_RUNS,
+    ):
+        self.path = path or os.environ.get(STORE_ENV_VAR) or DEFAULT_STORE_PATH
+        self.max_age = max_age
+        self.max_runs = max_runs
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(runs)")]
+        if columns and "owner" not in columns:
+            self._conn.executescript(_MIGRATE_ADD_OWNER)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "RunStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----- escritura -----
+
+    def save(
+        self,
+        configs: Sequence[ScenarioConfig],
+        result: Dict[str, Any],
+        num_steps: int = 600,
+        owner: str = "",
+    ) -> int:
+        """
+        Guarda en una sola transacción las corridas de un resultado de
+        compute_scenarios_batch / evaluate_batch (o de compute_scenario con una
+        sola config) a nombre de `owner`, y aplica la retención. Las que ya
+        existían se conservan. Devuelve cuántas se insertaron.
+        """
+        records = batch_to_records(result)
+        if len(records) != len(configs):
+            raise ValueError("Debe haber una config por cada fila del resultado.")
+        # El registro se guarda en la precisión pedida por cada config (un lote
+        # mixto se calcula en float64)
+        by_precision = {
+            p: records.astype(scenario_record_dtype(p), copy=False)
+            for p in {c.precision for c in configs}
+        }
+        now = time.time()
+        series = {}
+        rows = []
+        for i, config in enumerate(configs):
+            record = by_precision[config.precision][i]
+            sid = inflation_series_id(config.inflation_percent)
+            series[sid] = np.ascontiguousarray(
+                config.inflation_percent, dtype=np.float64
+            ).tobytes()
+            c = config.consumption
+            rows.append(
+                (
+                    owner,
+                    run_key(config, num_steps),
+                    now,
+                    float(c.alpha),
+                    float(c.beta),
+                    float(c.gamma),
+                    float(config.inflation_factor),
+                    config.method,
+                    config.precision,
+                    num_steps,
+                    sid,
+                    float(record["G_nom"]),
+                    float(record["G_real"]),
+                    float(record["delta"]),
+                    record.tobytes(),
+                )
+            )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO inflation_series (id, values_pct) VALUES (?, ?)",
+                list(series.items()),
+            )
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO runs (owner, run_key, created_at, alpha, beta, "
+                "gamma, kappa, method, precision, num_steps, series_id, G_nom, "
+                "G_real, delta, record) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            inserted = self._conn.total_changes - before
+            self._prune(now, [owner])
+            return inserted
+
+    def prune(self) -> None:
+        """Borra las corridas vencidas y, por dueño, las que exceden max_runs."""
+        with self._lock, self._conn:
+            owners = [
+                row[0] for row in self._conn.execute("SELECT DISTINCT owner FROM runs")
+            ]
+            self._prune(time.time(), owners)
+
+    def _prune(self, now: float, owners: Sequence[str]) -> None:
+        if self.max_age is not None:
+            self._conn.execute(
+                "DELETE FROM runs WHERE created_at < ?", (now - self.max_age,)
+            )
+        if self.max_runs is not None:
+            for owner in owners:
+                self._conn.execute(
+                    "DELETE FROM runs WHERE owner = ? AND id NOT IN (SELECT id "
+                    "FROM runs WHERE owner = ? ORDER BY created_at DESC, id DESC "
+                    "LIMIT ?)",
+                    (owner, owner, int(self.max_runs)),
+                )
+        self._conn.execute(
+            "DELETE FROM inflation_series WHERE id NOT IN "
+            "(SELECT series_id FROM runs)"
+        )
+
+    # ----- lectura -----
+
+    def lookup(
+        self, configs: Sequence[ScenarioConfig], num_steps: int = 600
+    ) -> List[Optional[np.void]]:
+        """
+        Registro guardado de cada config (None si no se ha calculado). Busca en
+        todos los dueños: el registro solo depende de las entradas, que quien
+        consulta ya conoce.
+        """
+        keys = [run_key(c, num_steps) for c in configs]
+        found: Dict[str, Tuple[str, bytes]] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique), _KEYS_PER_QUERY):
+                chunk = unique[start : start + _KEYS_PER_QUERY]
+                marks = ", ".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT run_key, precision, record FROM runs "
+                    f"WHERE run_key IN ({marks})",
+                    chunk,
+                ):
+                    found[row["run_key"]] = (row["precision"], row["record"])
+        out = []
+        for key in keys:
+            if key not in found:
+                out.append(None)
+                continue
+            precision, blob = found[key]
+            out.append(np.frombuffer(blob, dtype=scenario_record_dtype(precision))[0])
+        return out
+
+    def query(
+        self,
+        alpha: Optional[Tuple[float, float]] = None,
+        kappa: Optional[Tuple[float, float]] = None,
+        methods: Optional[Sequence[str]] = None,
+        series_id: Optional[str] = None,
+        limit: int = 200,
+        owner: str = "",
+    ) -> List[Dict[str, Any]]:
+        """
+        Corridas de `owner` que cumplen los filtros (rangos cerrados para α y
+        κ), de la más reciente a la más antigua, sin el registro binario.
+        """
+        where, args = ["owner = ?"], [owner]
+        if alpha is not None:
+            where.append("alpha BETWEEN ? AND ?")
+            args.extend(alpha)
+        if kappa is not None:
+            where.append("kappa BETWEEN ? AND ?")
+            args.extend(kappa)
+        if methods:
+            where.append(f"method IN ({', '.join('?' * len(methods))})")
+            args.extend(methods)
+        if series_id is not None:
+            where.append("series_id = ?")
+            args.append(series_id)
+        sql = f"SELECT {_RUN_COLUMNS} FROM runs WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        args.append(int(limit))
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, args)]
+
+    def load(self, run_id: int, owner: str = "") -> Tuple[ScenarioConfig, np.void]:
+        """Config y registro de una corrida de `owner`, listos para mostrarse."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT r.*, s.values_pct FROM runs r "
+                "JOIN inflation_series s ON s.id = r.series_id "
+                "WHERE r.id = ? AND r.owner = ?",
+                (int(run_id), owner),
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No existe la corrida {run_id}.")
+        config = ScenarioConfig(
+            consumption=SeasonalConsumptionParams(
+                alpha=row["alpha"], beta=row["beta"], gamma=row["gamma"]
+            ),
+            inflation_percent=np.frombuffer(row["values_pct"], dtype=np.float64).copy(),
+            inflation_factor=row["kappa"],
+            method=row["method"],
+            precision=row["precision"],
+        )
+        record = np.frombuffer(
+            row["record"], dtype=scenario_record_dtype(row["precision"])
+        )[0]
+        return config, record
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def cached_scenario_records(
+    configs: Sequence[ScenarioConfig], store: RunStore, num_steps: int = 600
+) -> np.ndarray:
+    """
+    Registros (S,) de las configs: los que ya están en el almacén se leen de
+    disco y los que faltan se calculan en lote (uno por precisión) y se guardan.
+    """
+    cached = store.lookup(configs, num_steps)
+    # Un lote por precisión, para que lo calculado coincida con lo que se relee
+    for precision in dict.fromkeys(c.precision for c in configs):
+        missing = [
+            i
+            for i, rec in enumerate(cached)
+            if rec is None and configs[i].precision == precision
+        ]
+        if not missing:
+            continue
+        miss_configs = [configs[i] for i in missing]
+        batch = compute_scenarios_fused(miss_configs, num_steps=num_steps)
+        store.save(miss_configs, batch, num_steps)
+        for i, rec in zip(missing, batch_to_records(batch)):
+            cached[i] = rec
+    # Unifica el tipo (float64 si hay mezcla de precisiones)
+    precision = (
+        "float32" if all(c.precision == "float32" for c in configs) else "float64"
+    )
+    records = np.empty(len(configs), dtype=scenario_record_dtype(precision))
+    for i, rec in enumerate(cached):
+        records[i] = rec
+    return records
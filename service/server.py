@@ -0,0 +1,598 @@
+"""
+Servicio HTTP/JSON asíncrono sobre el motor de `core`.
+
+Endpoints:
+    GET  /health      → estado y contadores de micro-lotes
+    POST /scenario    → un escenario; las peticiones concurrentes se agrupan en
+                        un solo llamado vectorizado al motor en lote
+    POST /batch       → varios escenarios en un solo llamado
+    POST /montecarlo  → simulación Monte Carlo de trayectorias de inflación
+
+Las respuestas son JSON, o un archivo .npz con los mismos arreglos si la
+petición trae "Accept: application/octet-stream". El trabajo numérico corre en
+un pool de procesos (o hilos) para no bloquear el loop de asyncio.
+
+Con --store, /scenario y /batch (sin series) responden desde el almacén de
+corridas (core.store) lo que ya se calculó, también tras reiniciar el servicio,
+y guardan lo nuevo.
+
+Uso:
+    python -m service.server --host 127.0.0.1 --port 8765 [--store runs.sqlite]
+"""
+
+import argparse
+import asyncio
+import io
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.analytics import (
+    PRECISION_DTYPES,
+    ScenarioConfig,
+    batch_to_records,
+    compute_scenarios_batch,
+)
+from core.consumption import SeasonalConsumptionParams
+from core.inflation import DEFAULT_INFLATION_PERCENT, MONTH_LABELS
+from core.integration import INTEGRATORS
+from core.montecarlo import DEFAULT_PERCENTILES, MonteCarloConfig, run_monte_carlo
+from core.kernels import compute_scenarios_fused
+from core.store import RunStore, cached_scenario_records
+
+MAX_BODY_BYTES = 1 << 20  # 1 MiB
+MAX_BATCH_SCENARIOS = 10_000
+MAX_MC_PATHS = 1_000_000
+
+JSON_TYPE = "application/json"
+BINARY_TYPE = "application/octet-stream"
+
+METRIC_KEYS = ("G_nom", "G_real", "delta", "inflation_avg_pct", "inflation_accum_pct")
+SERIES_KEYS = ("c_t", "D_t", "f_t", "G_real_acum")
+
+
+class BadRequest(ValueError):
+    """Error de validación de la petición (se responde con 400)."""
+
+
+# ---------------------------------------------------------------------------
+# Validación de entrada
+# ---------------------------------------------------------------------------
+
+
+def parse_scenario(payload: Dict[str, Any]) -> ScenarioConfig:
+    """Convierte el JSON de un escenario en ScenarioConfig (α obligatorio)."""
+    if not isinstance(payload, dict):
+        raise BadRequest("Cada escenario debe ser un objeto JSON.")
+    try:
+        alpha = float(payload["alpha"])
+        beta = float(payload.get("beta", 0.0))
+        gamma = float(payload.get("gamma", 0.0))
+        factor = float(payload.get("inflation_factor", 1.0))
+        inflation = np.asarray(
+            payload.get("inflation_percent", DEFAULT_INFLATION_PERCENT), dtype=float
+        )
+    except KeyError:
+        raise BadRequest("Falta el campo 'alpha'.")
+    except (TypeError, ValueError):
+        raise BadRequest("Los campos numéricos del escenario no son válidos.")
+    if inflation.shape != (12,):
+        raise BadRequest("'inflation_percent' debe tener 12 valores.")
+    if not (
+        np.isfinite([alpha, beta, gamma, factor]).all() and np.isfinite(inflation).all()
+    ):
+        raise BadRequest("Los campos numéricos del escenario deben ser finitos.")
+    if np.any(inflation * factor <= -100.0):
+        raise BadRequest("La inflación escalada por κ debe ser mayor a -100 %.")
+    method = payload.get("method", "Simpson")
+    if not isinstance(method, str) or method not in INTEGRATORS:
+        raise BadRequest(f"Método desconocido: {method!r}.")
+    precision = payload.get("precision", "float64")
+    if not isinstance(precision, str) or precision not in PRECISION_DTYPES:
+        raise BadRequest(f"Precisión desconocida: {precision!r}.")
+    return ScenarioConfig(
+        consumption=SeasonalConsumptionParams(alpha=alpha, beta=beta, gamma=gamma),
+        inflation_percent=inflation,
+        inflation_factor=factor,
+        method=method,
+        precision=precision,
+    )
+
+
+def parse_monte_carlo(payload: Dict[str, Any]) -> Tuple[MonteCarloConfig, List[float]]:
+    seed = payload.get("seed")
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+        raise BadRequest("'seed' debe ser un entero o null.")
+    try:
+        mc = MonteCarloConfig(
+            n_paths=int(payload.get("n_paths", MonteCarloConfig.n_paths)),
+            sigma_pct=float(payload.get("sigma_pct", MonteCarloConfig.sigma_pct)),
+            seed=seed,
+            chunk_size=int(payload.get("chunk_size", MonteCarloConfig.chunk_size)),
+        )
+        percentiles = [
+            float(p) for p in payload.get("percentiles", DEFAULT_PERCENTILES)
+        ]
+    except (TypeError, ValueError):
+        raise BadRequest("Parámetros de Monte Carlo no válidos.")
+    if not 1 <= mc.n_paths <= MAX_MC_PATHS:
+        raise BadRequest(f"'n_paths' debe estar entre 1 y {MAX_MC_PATHS}.")
+    if mc.chunk_size < 1 or not 0 <= mc.sigma_pct < float("inf"):
+        raise BadRequest("'chunk_size' debe ser ≥ 1 y 'sigma_pct' finito y ≥ 0.")
+    # Acota la memoria de cada bloque: (chunk_size, N) por trabajador
+    mc.chunk_size = min(mc.chunk_size, MAX_BATCH_SCENARIOS)
+    if not all(0.0 <= p <= 100.0 for p in percentiles):
+        raise BadRequest("Los percentiles deben estar entre 0 y 100.")
+    return mc, percentiles
+
+
+# ---------------------------------------------------------------------------
+# Trabajo numérico (funciones de módulo: se envían al pool de procesos)
+# ---------------------------------------------------------------------------
+
+
+# Un almacén abierto por proceso del pool (las conexiones no se serializan)
+_stores: Dict[str, RunStore] = {}
+
+
+def _open_store(path: str) -> RunStore:
+    if path not in _stores:
+        _stores[path] = RunStore(path)
+    return _stores[path]
+
+
+def run_batch(
+    configs: List[ScenarioConfig], series: bool, store_path: Optional[str] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Un llamado al motor en lote; devuelve solo arreglos planos. Con store_path,
+    las métricas que ya están en el almacén se leen de disco y solo se calcula
+    lo que falta (las series no se guardan: con series=True se calcula todo).
+    """
+    store = _open_store(store_path) if store_path else None
+    if not series:
+        # Solo métricas: kernel fusionado, sin series (S, N)
+        if store is not None:
+            records = cached_scenario_records(configs, store)
+        else:
+            records = batch_to_records(compute_scenarios_fused(configs))
+        out = {key: records[key] for key in METRIC_KEYS}
+        out["G_nom_mes"] = records["G_nom_mes"]
+        out["G_real_mes"] = records["G_real_mes"]
+        return out
+    batch = compute_scenarios_batch(configs)
+    if store is not None:
+        store.save(configs, batch)
+    out = {key: batch["metrics"][key] for key in METRIC_KEYS}
+    out["G_nom_mes"] = batch["G_nom_mes"]
+    out["G_real_mes"] = batch["G_real_mes"]
+    if series:
+        out["t"] = batch["t"]
+        for key in SERIES_KEYS:
+            out[key] = np.ascontiguousarray(batch[key])
+    return out
+
+
+def run_monte_carlo_job(
+    config: ScenarioConfig,
+    mc: MonteCarloConfig,
+    percentiles: List[float],
+    samples: bool,
+) -> Dict[str, np.ndarray]:
+    summary = run_monte_carlo(config, mc, percentiles)
+    out = {
+        "n_paths": np.asarray(summary["n_paths"]),
+        "percentiles": summary["percentiles"],
+        "G_real_pct": summary["G_real_pct"],
+        "delta_pct": summary["delta_pct"],
+        "t_bands": summary["t_bands"],
+        "bands": summary["bands"],
+        "G_real_mean": np.asarray(summary["G_real_mean"]),
+        "G_real_std": np.asarray(summary["G_real_std"]),
+    }
+    if samples:
+        out["G_real"] = summary["G_real"]
+        out["delta"] = summary["delta"]
+    return out
+
+
+def _row(batch_out: Dict[str, np.ndarray], i: int, series: bool) -> Dict[str, Any]:
+    """Extrae la fila i de un resultado en lote."""
+    row = {key: batch_out[key][i] for key in METRIC_KEYS}
+    row["months"] = np.asarray(MONTH_LABELS)
+    row["G_nom_mes"] = batch_out["G_nom_mes"][i]
+    row["G_real_mes"] = batch_out["G_real_mes"][i]
+    if series:
+        row["t"] = batch_out["t"]
+        for key in SERIES_KEYS:
+            row[key] = batch_out[key][i]
+    return row
+
+
+# ---------------------------------------------------------------------------
+# Micro-lotes
+# ---------------------------------------------------------------------------
+
+
+class MicroBatcher:
+    """
+    Agrupa las peticiones /scenario que llegan dentro de max_delay segundos (o
+    hasta max_batch) en un solo llamado a run_batch en el pool.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_batch: int = 256,
+        max_delay: float = 0.005,
+        store_path: Optional[str] = None,
+    ):
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.store_path = store_path
+        self.batches_run = 0
+        self.requests_served = 0
+        self._pending: List[Tuple[ScenarioConfig, bool, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def submit(
+        self, config: ScenarioConfig, series: bool = False
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((config, series, fut))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await fut
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending):
+        loop = asyncio.get_running_loop()
+        configs = [config for config, _, _ in pending]
+        series = any(s for _, s, _ in pending)
+        try:
+            out = await loop.run_in_executor(
+                self.executor, run_batch, configs, series, self.store_path
+            )
+        except Exception as exc:  # se propaga a cada petición del lote
+            for _, _, fut in pending:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        self.batches_run += 1
+        self.requests_served += len(pending)
+        for i, (_, s, fut) in enumerate(pending):
+            if not fut.done():
+                fut.set_result(_row(out, i, s))
+
+
+# ---------------------------------------------------------------------------
+# Codificación de respuestas
+# ---------------------------------------------------------------------------
+
+
+def _jsonable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def encode_json(data: Dict[str, Any]) -> bytes:
+    """JSON estricto: un valor no finito lanza ValueError (no emite NaN/Infinity)."""
+    return json.dumps(
+        {k: _jsonable(v) for k, v in data.items()}, allow_nan=False
+    ).encode("utf-8")
+
+
+def encode_npz(data: Dict[str, Any]) -> bytes:
+    buf = io.BytesIO()
+    np.savez(buf, **{k: np.asarray(v) for k, v in data.items()})
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Servidor HTTP mínimo (HTTP/1.1 con keep-alive)
+# ---------------------------------------------------------------------------
+
+
+class ScenarioService:
+    """Servidor HTTP/JSON sobre asyncio.start_server."""
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_batch: int = 256,
+        max_delay: float = 0.005,
+        store_path: Optional[str] = None,
+    ):
+        self._owns_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor()
+        self.store_path = store_path
+        self.batcher = MicroBatcher(self.executor, max_batch, max_delay, store_path)
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.AbstractServer:
+        """Arranca el servidor; con port=0 el sistema elige un puerto libre."""
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, content_type, payload = await self.dispatch(
+                    method, path, headers, body
+                )
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, content_type, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except BadRequest as exc:
+            _write_response(
+                writer,
+                HTTPStatus.BAD_REQUEST,
+                JSON_TYPE,
+                encode_json({"error": str(exc)}),
+                keep_alive=False,
+            )
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[HTTPStatus, str, bytes]:
+        binary = BINARY_TYPE in headers.get("accept", "")
+        route = self._routes().get(path)
+        if route is None:
+            return _error(HTTPStatus.NOT_FOUND, f"Ruta desconocida: {path}")
+        allowed, handler = route
+        if method != allowed:
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED, f"Usa {allowed} en {path}.")
+        try:
+            payload = json.loads(body or b"{}") if method == "POST" else {}
+            if not isinstance(payload, dict):
+                raise BadRequest("El cuerpo debe ser un objeto JSON.")
+            data = await handler(payload)
+        except (BadRequest, json.JSONDecodeError) as exc:
+            return _error(HTTPStatus.BAD_REQUEST, str(exc))
+        except Exception as exc:
+            return _error(
+                HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}"
+            )
+        if binary:
+            return HTTPStatus.OK, BINARY_TYPE, encode_npz(data)
+        try:
+            return HTTPStatus.OK, JSON_TYPE, encode_json(data)
+        except ValueError:
+            return _error(
+                HTTPStatus.BAD_REQUEST,
+                "El resultado no es finito con estos datos; revisa las entradas.",
+            )
+
+    def _routes(self):
+        return {
+            "/health": ("GET", self._health),
+            "/scenario": ("POST", self._scenario),
+            "/batch": ("POST", self._batch),
+            "/montecarlo": ("POST", self._monte_carlo),
+        }
+
+    async def _health(self, payload):
+        return {
+            "status": "ok",
+            "batches_run": self.batcher.batches_run,
+            "requests_served": self.batcher.requests_served,
+        }
+
+    async def _scenario(self, payload):
+        config = parse_scenario(payload)
+        return await self.batcher.submit(config, bool(payload.get("series", False)))
+
+    async def _batch(self, payload):
+        scenarios = payload.get("scenarios")
+        if not isinstance(scenarios, list) or not scenarios:
+            raise BadRequest("'scenarios' debe ser una lista no vacía.")
+        if len(scenarios) > MAX_BATCH_SCENARIOS:
+            raise BadRequest(f"Máximo {MAX_BATCH_SCENARIOS} escenarios por lote.")
+        configs = [parse_scenario(s) for s in scenarios]
+        labels = payload.get("labels")
+        if labels is None:
+            labels = [f"Escenario {i + 1}" for i in range(len(configs))]
+        elif not isinstance(labels, list) or not all(
+            isinstance(lbl, str) for lbl in labels
+        ):
+            raise BadRequest("'labels' debe ser una lista de textos.")
+        if len(labels) != len(configs):
+            raise BadRequest("Debe haber una etiqueta por escenario.")
+        loop = asyncio.get_running_loop()
+        out = await loop.run_in_executor(
+            self.executor,
+            run_batch,
+            configs,
+            bool(payload.get("series", False)),
+            self.store_path,
+        )
+        out["labels"] = np.asarray(labels)
+        out["months"] = np.asarray(MONTH_LABELS)
+        return out
+
+    async def _monte_carlo(self, payload):
+        config = parse_scenario(payload.get("scenario", {}))
+        mc, percentiles = parse_monte_carlo(payload)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            run_monte_carlo_job,
+            config,
+            mc,
+            percentiles,
+            bool(payload.get("samples", False)),
+        )
+
+
+def _error(status: HTTPStatus, message: str) -> Tuple[HTTPStatus, str, bytes]:
+    return status, JSON_TYPE, encode_json({"error": message})
+
+
+async def _read_request(reader):
+    """Lee una petición HTTP/1.1; None si el cliente cerró la conexión."""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise BadRequest("Línea de petición mal formada.")
+    headers = {}
+    while True:
+        raw = await reader.readline()
+        if raw in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = raw.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", "0") or 0)
+    except ValueError:
+        raise BadRequest("Content-Length no válido.")
+    if length < 0:
+        raise BadRequest("Content-Length no válido.")
+    if length > MAX_BODY_BYTES:
+        raise BadRequest("Cuerpo demasiado grande.")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], headers, body
+
+
+def _write_response(writer, status, content_type, payload: bytes, keep_alive: bool):
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + payload)
+
+
+# ---------------------------------------------------------------------------
+# Cliente mínimo (para pruebas locales contra el puerto de loopback)
+# ---------------------------------------------------------------------------
+
+
+async def fetch(
+    host: str,
+    port: int,
+    method: str,
+    path: str,
+    payload: Optional[Dict[str, Any]] = None,
+    binary: bool = False,
+) -> Tuple[int, Any]:
+    """
+    Hace una petición al servicio y devuelve (status, datos): dict para JSON o
+    un dict de arreglos para respuestas .npz.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    head = (
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: {JSON_TYPE}\r\nContent-Length: {len(body)}\r\n"
+        f"Accept: {BINARY_TYPE if binary else JSON_TYPE}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    status_line = await reader.readline()
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        raw = await reader.readline()
+        if raw in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = raw.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    data = await reader.readexactly(int(headers.get("content-length", "0")))
+    writer.close()
+    if headers.get("content-type") == BINARY_TYPE:
+        with np.load(io.BytesIO(data)) as npz:
+            return status, {key: npz[key] for key in npz.files}
+    return status, json.loads(data)
+
+
+# ---------------------------------------------------------------------------
+# Punto de entrada
+# ---------------------------------------------------------------------------
+
+
+async def _serve(args):
+    executor = (
+        ThreadPoolExecutor(max_workers=args.workers)
+        if args.threads
+        else ProcessPoolExecutor(max_workers=args.workers)
+    )
+    service = ScenarioService(
+        executor, args.max_batch, args.max_delay_ms / 1000.0, args.store
+    )
+    await service.start(args.host, args.port)
+    print(f"Servicio escuchando en http://{args.host}:{service.port}")
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON del presupuesto.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--threads", action="store_true", help="pool de hilos")
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-delay-ms", type=float, default=5.0)
+    parser.add_argument(
+        "--store", default=None, help="base SQLite de corridas (core.store)"
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,40 @@
 import streamlit as st
-from utils.formatting import format_currency, format_percent
+from utils.formatting import format_currency_array, format_percent_array
 
 
 def render_kpi_row(metrics: dict):
     col1, col2, col3, col4 = st.columns(4)
 
+    # Un solo llamado vectorizado por tipo de formato
+    g_nom, g_real, delta = format_currency_array(
+        [metrics["G_nom"], metrics["G_real"], metrics["delta"]]
+    )
+    infl_avg, infl_accum = format_percent_array(
+        [metrics["inflation_avg_pct"], metrics["inflation_accum_pct"]]
+    )
+
     with col1:
         _kpi_card(
             title="Gasto nominal anual",
-            value=format_currency(metrics["G_nom"]),
+            value=g_nom,
             subtitle="Suma de todo lo que pagarías en el año si los precios se quedaran como hoy.",
         )
     with col2:
         _kpi_card(
             title="Gasto real anual",
-            value=format_currency(metrics["G_real"]),
+            value=g_real,
             subtitle="Lo mismo, pero expresado en “pesos de hoy” después de descontar la inflación.",
         )
     with col3:
         _kpi_card(
             title="Pérdida de poder adquisitivo",
-            value=format_currency(metrics["delta"]),
+            value=delta,
             subtitle="Es la parte del gasto que se explica solo por el aumento de precios.",
         )
     with col4:
         sub = (
-            f"Inflación promedio del año: {format_percent(metrics['inflation_avg_pct'])}\n"
-            f"Inflación acumulada: {format_percent(metrics['inflation_accum_pct'])}"
+            f"Inflación promedio del año: {infl_avg}\n"
+            f"Inflación acumulada: {infl_accum}"
         )
         _kpi_card(
             title="Inflación del periodo",
@@ -1,9 +1,12 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
+from typing import Optional
 
+from ui.figure_cache import render_cached_chart
 
-def render_main_charts(df_tiempo: pd.DataFrame):
+
+def render_main_charts(df_tiempo: pd.DataFrame, result_hash: Optional[str] = None):
     st.subheader("Perfil de consumo nominal vs real")
     st.markdown(
         """
@@ -14,24 +17,27 @@ def render_main_charts(df_tiempo: pd.DataFrame):
         """
     )
 
-    df_line = df_tiempo[
-        [
-            "t_mes",
-            "Consumo nominal (COP/mes)",
-            "Consumo real instantáneo (COP/mes)",
-        ]
-    ].copy()
-    fig1 = px.line(
-        df_line,
-        x="t_mes",
-        y=[
-            "Consumo nominal (COP/mes)",
-            "Consumo real instantáneo (COP/mes)",
-        ],
-        labels={"t_mes": "Tiempo (meses)"},
-    )
-    fig1.update_layout(margin=dict(l=10, r=10, t=40, b=10))
-    st.plotly_chart(fig1, use_container_width=True)
+    def build_profile():
+        df_line = df_tiempo[
+            [
+                "t_mes",
+                "Consumo nominal (COP/mes)",
+                "Consumo real instantáneo (COP/mes)",
+            ]
+        ].copy()
+        fig1 = px.line(
+            df_line,
+            x="t_mes",
+            y=[
+                "Consumo nominal (COP/mes)",
+                "Consumo real instantáneo (COP/mes)",
+            ],
+            labels={"t_mes": "Tiempo (meses)"},
+        )
+        fig1.update_layout(margin=dict(l=10, r=10, t=40, b=10))
+        return fig1
+
+    render_cached_chart("perfil", result_hash, build_profile, df_tiempo)
 
     st.subheader("Gasto real acumulado a lo largo del año")
     st.markdown(
@@ -44,11 +50,14 @@ def render_main_charts(df_tiempo: pd.DataFrame):
         """
     )
 
-    fig2 = px.line(
-        df_tiempo,
-        x="t_mes",
-        y="Gasto real acumulado (COP)",
-        labels={"t_mes": "Tiempo (meses)"},
-    )
-    fig2.update_layout(margin=dict(l=10, r=10, t=40, b=10))
-    st.plotly_chart(fig2, use_container_width=True)
+    def build_cumulative():
+        fig2 = px.line(
+            df_tiempo,
+            x="t_mes",
+            y="Gasto real acumulado (COP)",
+            labels={"t_mes": "Tiempo (meses)"},
+        )
+        fig2.update_layout(margin=dict(l=10, r=10, t=40, b=10))
+        return fig2
+
+    render_cached_chart("acumulado", result_hash, build_cumulative, df_tiempo)
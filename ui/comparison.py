@@ -0,0 +1,177 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from core.analytics import ScenarioConfig, compute_scenarios_batch
+from core.consumption import SeasonalConsumptionParams
+from core.inflation import DEFAULT_INFLATION_PERCENT
+from ui.figure_cache import render_cached_chart
+from ui.sidebar import SCENARIO_FACTORS, METHOD_LABELS
+from ui.tables import numeric_column_config
+from utils.session_state import config_key
+
+
+def build_comparison_configs(
+    params: SeasonalConsumptionParams,
+    tables: dict,
+    scenarios: dict,
+    method_labels: list,
+):
+    """
+    Combina tablas de inflación × escenarios (κ) × métodos en una lista de
+    configs con su etiqueta. tables y scenarios van de etiqueta a valor; la
+    etiqueta solo nombra lo que tiene más de una opción elegida.
+    """
+    configs, labels = [], []
+    for tabla, inflation in tables.items():
+        for esc, kappa in scenarios.items():
+            for met in method_labels:
+                configs.append(
+                    ScenarioConfig(
+                        consumption=params,
+                        inflation_percent=inflation,
+                        inflation_factor=kappa,
+                        method=METHOD_LABELS[met],
+                    )
+                )
+                parts = [esc]
+                if len(tables) > 1:
+                    parts.append(tabla)
+                if len(method_labels) > 1:
+                    parts.append(met.split(" ")[0])
+                labels.append(" · ".join(parts))
+    return configs, labels
+
+
+def comparison_key(configs: list, labels: list) -> str:
+    """Clave de las figuras de la comparación: entradas de cada escenario y etiquetas."""
+    key = repr(([config_key(c, with_inflation=True) for c in configs], labels))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def render_scenario_comparison(
+    params: SeasonalConsumptionParams,
+    inflation_array: np.ndarray,
+    current_method: str,
+    current_kappa: float,
+):
+    st.subheader("Comparar escenarios lado a lado")
+    st.markdown(
+        """
+        En lugar de cambiar el escenario en el panel lateral una y otra vez,
+        elige aquí varios escenarios y los calculamos **todos a la vez**.
+        """
+    )
+    # Opcional: el cálculo en lote y sus gráficos no corren en cada rerun
+    if not st.toggle("Mostrar la comparación", value=False):
+        return
+
+    # Tablas: la del panel lateral y, si se editó, también la de ejemplo DANE
+    table_options = {"Tabla del panel lateral": inflation_array}
+    if not np.array_equal(inflation_array, DEFAULT_INFLATION_PERCENT):
+        table_options["Datos DANE"] = DEFAULT_INFLATION_PERCENT
+    # Escenarios: los predefinidos y, si es otro, el κ del panel lateral
+    scenario_options = dict(SCENARIO_FACTORS)
+    if float(current_kappa) not in scenario_options.values():
+        scenario_options[f"Personalizado (κ = {current_kappa:g})"] = float(
+            current_kappa
+        )
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        scenario_labels = st.multiselect(
+            "Escenarios a comparar",
+            list(scenario_options),
+            default=list(scenario_options),
+        )
+    with col2:
+        table_labels = st.multiselect(
+            "Tablas de inflación",
+            list(table_options),
+            default=list(table_options)[:1],
+        )
+    with col3:
+        current_label = next(
+            (lbl for lbl, m in METHOD_LABELS.items() if m == current_method),
+            next(iter(METHOD_LABELS)),
+        )
+        method_labels = st.multiselect(
+            "Formas de cálculo",
+            list(METHOD_LABELS),
+            default=[current_label],
+        )
+
+    if not scenario_labels or not table_labels or not method_labels:
+        st.info("Elige al menos un escenario, una tabla y una forma de cálculo.")
+        return
+
+    configs, labels = build_comparison_configs(
+        params,
+        {lbl: table_options[lbl] for lbl in table_labels},
+        {lbl: scenario_options[lbl] for lbl in scenario_labels},
+        method_labels,
+    )
+    batch = compute_scenarios_batch(configs, labels=labels)
+
+    # Un único DataFrame "largo" construido desde los arreglos (S, N) compartidos
+    def long_frame():
+        t = batch["t"]
+        n_scen = len(labels)
+        return pd.DataFrame(
+            {
+                "t_mes": np.tile(t, n_scen),
+                "Escenario": np.repeat(labels, len(t)),
+                "Consumo real instantáneo (COP/mes)": batch["f_t"].ravel(),
+                "Gasto real acumulado (COP)": batch["G_real_acum"].ravel(),
+            }
+        )
+
+    def build_line(column):
+        def build():
+            fig = px.line(
+                long_frame(),
+                x="t_mes",
+                y=column,
+                color="Escenario",
+                labels={"t_mes": "Tiempo (meses)"},
+            )
+            fig.update_layout(margin=dict(l=10, r=10, t=40, b=10))
+            return fig
+
+        return build
+
+    key = comparison_key(configs, labels)
+    render_cached_chart(
+        "comparacion_consumo",
+        key,
+        build_line("Consumo real instantáneo (COP/mes)"),
+    )
+    render_cached_chart(
+        "comparacion_acumulado", key, build_line("Gasto real acumulado (COP)")
+    )
+
+    # Tabla de métricas con diferencias frente al primer escenario elegido
+    m = batch["metrics"]
+    currency_cols = {
+        "Gasto nominal (COP)": m["G_nom"],
+        "Gasto real (COP)": m["G_real"],
+        "Pérdida de poder adquisitivo (COP)": m["delta"],
+        f"Δ gasto real vs {labels[0]} (COP)": m["G_real"] - m["G_real"][0],
+        f"Δ pérdida vs {labels[0]} (COP)": m["delta"] - m["delta"][0],
+    }
+    df_metrics = pd.DataFrame(
+        {
+            "Escenario": labels,
+            "κ": batch["kappa"],
+            **{col: np.round(v, 0) for col, v in currency_cols.items()},
+        }
+    )
+    st.dataframe(
+        df_metrics,
+        hide_index=True,
+        use_container_width=True,
+        column_config=numeric_column_config(list(currency_cols)),
+    )
@@ -0,0 +1,72 @@
+import streamlit as st
+import plotly.express as px
+
+from core.analytics import ScenarioConfig
+from core.convergence import (
+    integration_convergence_report,
+    choose_method_for_tolerance,
+    identical_methods,
+)
+from ui.sidebar import METHOD_LABELS
+from utils.session_state import config_key
+
+TOLERANCE_OPTIONS = [1e-3, 1e-4, 1e-5, 1e-6]
+_REPORT_KEY = "_integration_report"
+
+
+def render_integration_report(config: ScenarioConfig):
+    with st.expander("🔬 ¿Qué tan preciso y rápido es cada forma de cálculo?"):
+        st.markdown(
+            """
+            Compara las tres formas de cálculo contra el valor **exacto** del modelo
+            para mallas cada vez más finas, y mide cuánto tarda cada una.
+            """
+        )
+        tol = st.select_slider(
+            "Error relativo máximo aceptable",
+            options=TOLERANCE_OPTIONS,
+            value=1e-4,
+            format_func=lambda x: f"{x:.0e}",
+        )
+        # El reporte tarda unos segundos: queda en la sesión mientras no cambie
+        # el escenario, así se pueden probar otras tolerancias sin recalcularlo
+        key = config_key(config, with_inflation=True)
+        stored = st.session_state.get(_REPORT_KEY)
+        if st.button("Medir precisión y costo"):
+            report = integration_convergence_report(config, repeats=3, number=10)
+            st.session_state[_REPORT_KEY] = (key, report)
+        elif stored is not None and stored[0] == key:
+            report = stored[1]
+        else:
+            return
+
+        fig = px.line(
+            report,
+            x="Tiempo (ms)",
+            y="Error relativo",
+            color="Método",
+            markers=True,
+            hover_data=["Pasos"],
+            log_x=True,
+            log_y=True,
+        )
+        fig.update_layout(margin=dict(l=10, r=10, t=40, b=10))
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(report, hide_index=True, use_container_width=True)
+
+        labels = {m: lbl for lbl, m in METHOD_LABELS.items()}
+        for a, b in identical_methods(report):
+            st.caption(
+                f"“{labels.get(a, a)}” y “{labels.get(b, b)}” dan exactamente el mismo "
+                "resultado: usan la misma aritmética."
+            )
+
+        best = choose_method_for_tolerance(report, tol)
+        if best is None:
+            st.warning(f"Ninguna forma de cálculo alcanza un error ≤ {tol:.0e}.")
+        else:
+            st.success(
+                f"La opción más barata con error ≤ {tol:.0e} es "
+                f"**{labels.get(best['Método'], best['Método'])}** con "
+                f"{best['Pasos']} pasos ({best['Tiempo (ms)']:.3f} ms por cálculo)."
+            )
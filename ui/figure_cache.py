@@ -0,0 +1,52 @@
+"""
+Caché de figuras Plotly ya construidas, compartida entre reruns y sesiones.
+
+Cada figura se identifica por (nombre, hash del resultado). La primera vez se
+construye con plotly.express; las siguientes vistas del mismo resultado
+reutilizan el go.Figure ya armado y solo pasan por st.plotly_chart (API
+pública), sin volver a agrupar ni validar los datos con px. Lo que se ahorra es
+la construcción: st.plotly_chart sigue serializando la figura a JSON en cada
+rerun (unos 3 ms para el perfil de 601 puntos, frente a ~60 ms de armarla).
+"""
+
+import hashlib
+from typing import Any, Callable, Optional
+
+import pandas as pd
+import streamlit as st
+
+FIGURE_CACHE_MAX_ENTRIES = 256
+
+
+def frame_hash(df: pd.DataFrame) -> str:
+    """Hash estable del contenido de un DataFrame (respaldo si no hay result_hash)."""
+    h = hashlib.blake2b(digest_size=16)
+    for col in df.columns:
+        h.update(str(col).encode("utf-8"))
+        values = df[col].to_numpy()
+        if values.dtype.kind in "biuf":
+            h.update(values.tobytes())
+        else:
+            h.update("\x1f".join(map(str, values)).encode("utf-8"))
+    return h.hexdigest()
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def _get_cached_figure(name: str, result_hash: str, _build) -> Any:
+    return _build()
+
+
+def render_cached_chart(
+    name: str,
+    result_hash: Optional[str],
+    build: Callable[[], Any],
+    fallback_df: Optional[pd.DataFrame] = None,
+):
+    """
+    Muestra la figura `name` para el resultado `result_hash`, construyéndola
+    con `build()` solo si no está en caché.
+    """
+    if result_hash is None:
+        result_hash = frame_hash(fallback_df) if fallback_df is not None else ""
+    figure = _get_cached_figure(name, result_hash, build)
+    st.plotly_chart(figure, use_container_width=True, key=f"fig-{name}")
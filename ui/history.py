@@ -0,0 +1,141 @@
+import sqlite3
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.analytics import ScenarioConfig
+from core.inflation import MONTH_LABELS
+from core.store import RunStore, inflation_series_id
+from ui.cards import render_kpi_row
+from ui.sidebar import METHOD_LABELS
+from ui.tables import numeric_column_config
+from utils.session_state import get_session_owner
+
+
+@st.cache_resource(show_spinner=False)
+def get_run_store() -> Optional[RunStore]:
+    """Almacén de corridas compartido por las sesiones (None si no se puede abrir)."""
+    try:
+        return RunStore()
+    except sqlite3.Error:
+        return None
+
+
+def save_run(config: ScenarioConfig, results: dict, owner: str) -> bool:
+    """Guarda la corrida actual a nombre de la sesión; False si no se pudo."""
+    store = get_run_store()
+    if store is None:
+        return False
+    try:
+        store.save([config], results, owner=owner)
+    except sqlite3.Error:
+        return False  # el historial es opcional: la app sigue funcionando sin él
+    return True
+
+
+def render_run_history(config: ScenarioConfig, results: dict):
+    with st.expander("🗂️ Historial de escenarios guardados"):
+        store = get_run_store()
+        if store is None:
+            st.info("No se pudo abrir el historial en este equipo.")
+            return
+        st.markdown(
+            """
+            Guarda los escenarios que quieras volver a mirar y compáralos aquí
+            **sin recalcularlos**. Solo se ven en esta sesión del navegador.
+            """
+        )
+        owner = get_session_owner()
+        if st.button("💾 Guardar este escenario"):
+            if save_run(config, results, owner):
+                st.success("Escenario guardado.")
+            else:
+                st.warning("No se pudo guardar el escenario.")
+
+        labels = {m: lbl for lbl, m in METHOD_LABELS.items()}
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            methods = st.multiselect(
+                "Forma de cálculo",
+                list(METHOD_LABELS.values()),
+                format_func=lambda m: labels.get(m, m),
+            )
+        with col2:
+            kappa = st.slider("Multiplicador de inflación (κ)", 0.0, 2.0, (0.0, 2.0))
+        with col3:
+            same_series = st.checkbox(
+                "Solo con la tabla de inflación actual",
+                value=True,
+            )
+
+        rows = store.query(
+            kappa=kappa,
+            methods=methods or None,
+            series_id=(
+                inflation_series_id(config.inflation_percent) if same_series else None
+            ),
+            owner=owner,
+        )
+        if not rows:
+            st.info("Todavía no hay escenarios guardados con esos filtros.")
+            return
+
+        df_runs = pd.DataFrame(rows)
+        df_runs = pd.DataFrame(
+            {
+                "Id": df_runs["id"],
+                "Fecha": pd.to_datetime(df_runs["created_at"], unit="s"),
+                "Gasto mensual α (COP)": df_runs["alpha"].round(0),
+                "κ": df_runs["kappa"],
+                "Forma de cálculo": df_runs["method"].map(lambda m: labels.get(m, m)),
+                "Gasto nominal (COP)": df_runs["G_nom"].round(0),
+                "Gasto real (COP)": df_runs["G_real"].round(0),
+                "Pérdida de poder adquisitivo (COP)": df_runs["delta"].round(0),
+            }
+        )
+        currency_cols = [
+            "Gasto mensual α (COP)",
+            "Gasto nominal (COP)",
+            "Gasto real (COP)",
+            "Pérdida de poder adquisitivo (COP)",
+        ]
+        st.dataframe(
+            df_runs,
+            hide_index=True,
+            use_container_width=True,
+            column_config=numeric_column_config(currency_cols),
+        )
+
+        run_id = st.selectbox("Ver un escenario guardado", df_runs["Id"].tolist())
+        _, record = store.load(run_id, owner=owner)
+        render_kpi_row(
+            {
+                key: float(record[key])
+                for key in (
+                    "G_nom",
+                    "G_real",
+                    "delta",
+                    "inflation_avg_pct",
+                    "inflation_accum_pct",
+                )
+            }
+        )
+        df_mes = pd.DataFrame(
+            {
+                "Mes": MONTH_LABELS,
+                "Inflación mensual (%)": np.round(record["inflation_pct"], 3),
+                "Gasto nominal del mes (COP)": np.round(record["G_nom_mes"], 0),
+                "Gasto real del mes (COP)": np.round(record["G_real_mes"], 0),
+            }
+        )
+        st.dataframe(
+            df_mes,
+            hide_index=True,
+            use_container_width=True,
+            column_config=numeric_column_config(
+                ["Gasto nominal del mes (COP)", "Gasto real del mes (COP)"],
+                ["Inflación mensual (%)"],
+            ),
+        )
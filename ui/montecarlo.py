@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from core.analytics import ScenarioConfig
+from core.inflation import MONTH_LABELS
+from core.montecarlo import MonteCarloConfig, iter_monte_carlo_summaries
+from utils.formatting import format_currency_array
+from utils.jobs import Job
+from utils.session_state import config_key, get_job_manager
+
+_SLOT = "montecarlo"
+_POLL_SECONDS = 0.4
+PATH_OPTIONS = [10_000, 50_000, 100_000, 200_000]
+
+
+def _monte_carlo_job(job: Job, config: ScenarioConfig, mc: MonteCarloConfig):
+    """Simula por bloques: reporta el avance tras cada uno y publica los resúmenes."""
+    summary = None
+    for summary in iter_monte_carlo_summaries(
+        config, mc, on_chunk=lambda n: job.report(n / mc.n_paths)
+    ):
+        job.report(summary["n_paths"] / mc.n_paths, partial=summary)
+    return summary
+
+
+def render_monte_carlo(config: ScenarioConfig):
+    with st.expander("🎲 ¿Y si la inflación no sale exactamente así?"):
+        st.markdown(
+            """
+            Simulamos miles de años posibles en los que la inflación de cada mes
+            se desvía un poco de la tabla. Las bandas muestran entre qué valores
+            quedaría tu **gasto real acumulado** en la mayoría de los casos.
+            El cálculo corre en segundo plano: puedes seguir usando la página.
+            """
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            sigma = st.slider(
+                "Incertidumbre de la inflación de cada mes (puntos %)",
+                min_value=0.05,
+                max_value=1.0,
+                value=0.2,
+                step=0.05,
+            )
+        with col2:
+            n_paths = st.select_slider(
+                "Cantidad de años simulados",
+                options=PATH_OPTIONS,
+                value=50_000,
+                format_func=lambda n: f"{n:,}".replace(",", "."),
+            )
+
+        manager = get_job_manager()
+        if not st.toggle("Simular", value=False):
+            manager.cancel(_SLOT)
+            return
+
+        mc = MonteCarloConfig(n_paths=n_paths, sigma_pct=sigma, seed=0)
+        # Si cambian las entradas, la simulación anterior se cancela
+        key = config_key(config, with_inflation=True) + (float(sigma), int(n_paths))
+        job = manager.submit(_SLOT, key, _monte_carlo_job, config, mc)
+        # Mientras corre, solo este fragmento se vuelve a pintar cada _POLL_SECONDS
+        polling = not job.done
+        st.fragment(_render_job, run_every=_POLL_SECONDS if polling else None)(
+            job, n_paths, polling
+        )
+
+
+def _render_job(job: Job, n_paths: int, polling: bool):
+    """Muestra el avance y las bandas parciales del trabajo."""
+    if polling and job.done:
+        st.rerun()  # un rerun completo deja el fragmento sin sondeo
+    snap = job.snapshot()
+    if snap["status"] == "error":
+        st.error(f"La simulación falló: {snap['error']}")
+        return
+    if snap["status"] == "cancelled":
+        st.info("La simulación se canceló porque cambiaron los datos.")
+        return
+
+    summary = snap["result"] if snap["status"] == "done" else snap["partial"]
+    done = int(round(snap["progress"] * n_paths))
+    st.progress(
+        snap["progress"],
+        text=(
+            f"{done:,} de {n_paths:,} años simulados".replace(",", ".")
+            + f" · {snap['elapsed']:.1f} s"
+        ),
+    )
+
+    if summary is not None:
+        labels = [f"P{q:g}" for q in summary["percentiles"]]
+        bands = summary["bands"]
+        df_bands = pd.DataFrame(
+            {
+                "Mes": np.tile(["Inicio", *MONTH_LABELS], len(labels)),
+                "Percentil": np.repeat(labels, bands.shape[1]),
+                "Gasto real acumulado (COP)": bands.ravel(),
+            }
+        )
+        fig = px.line(
+            df_bands,
+            x="Mes",
+            y="Gasto real acumulado (COP)",
+            color="Percentil",
+        )
+        fig.update_layout(margin=dict(l=10, r=10, t=40, b=10))
+        st.plotly_chart(fig, use_container_width=True)
+
+        cols = st.columns(len(labels))
+        for col, label, value in zip(
+            cols, labels, format_currency_array(summary["G_real_pct"])
+        ):
+            col.metric(f"Gasto real anual {label}", value)
@@ -10,6 +10,20 @@ from core.inflation import (
 )
 from typing import Tuple
 
+# Escenarios predefinidos de precios → multiplicador κ
+SCENARIO_FACTORS = {
+    "Base (tal como está)": 1.0,
+    "Más baja (optimista)": 0.8,
+    "Más alta (crítica)": 1.2,
+}
+
+# Etiquetas de la UI → método numérico de core.integration
+METHOD_LABELS = {
+    "Estándar (recomendado)": "Simpson",  # más preciso
+    "Rápido (menos preciso)": "Rectángulos",  # más simple
+    "Conservador (suma un poco de margen)": "Trapecios",  # intermedio / conservador
+}
+
 
 def money_input(label: str, key: str, default: int, help: str | None = None) -> float:
     """
@@ -174,24 +188,19 @@ def render_sidebar() -> Tuple[SeasonalConsumptionParams, np.ndarray, float, str]
 
         escenario = st.radio(
             "Elige cómo de fuerte imaginas la inflación:",
-            [
-                "Base (tal como está)",
-                "Más baja (optimista)",
-                "Más alta (crítica)",
-                "Personalizado",
-            ],
+            [*SCENARIO_FACTORS, "Personalizado"],
         )
 
+        if escenario in SCENARIO_FACTORS:
+            k = SCENARIO_FACTORS[escenario]
+
         if escenario == "Base (tal como está)":
-            k = 1.0
             st.caption("Usas exactamente las tasas de inflación mostradas arriba.")
         elif escenario == "Más baja (optimista)":
-            k = 0.8
             st.caption(
                 "Supone que la inflación termina siendo un 20% más baja de lo que aparece en la tabla."
             )
         elif escenario == "Más alta (crítica)":
-            k = 1.2
             st.caption(
                 "Supone que la inflación termina siendo un 20% más alta de lo que aparece en la tabla."
             )
@@ -212,11 +221,7 @@ def render_sidebar() -> Tuple[SeasonalConsumptionParams, np.ndarray, float, str]
 
         metodo_label = st.selectbox(
             "¿Qué nivel de detalle quieres en el cálculo?",
-            [
-                "Estándar (recomendado)",
-                "Rápido (menos preciso)",
-                "Conservador (suma un poco de margen)",
-            ],
+            list(METHOD_LABELS),
             index=0,
             help=(
                 "Todas las opciones usan tus mismos datos. "
@@ -224,12 +229,7 @@ def render_sidebar() -> Tuple[SeasonalConsumptionParams, np.ndarray, float, str]
             ),
         )
 
-        if metodo_label.startswith("Estándar"):
-            method = "Simpson"  # más preciso
-        elif metodo_label.startswith("Rápido"):
-            method = "Rectángulos"  # más simple
-        else:
-            method = "Trapecios"  # intermedio / conservador
+        method = METHOD_LABELS[metodo_label]
 
         st.markdown('<hr class="sidebar-divider" />', unsafe_allow_html=True)
         st.caption(
@@ -2,10 +2,58 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
-from utils.formatting import format_currency, format_percent
-
-
-def render_monthly_table(df_mensual: pd.DataFrame):
+from typing import Optional
+
+from ui.figure_cache import render_cached_chart
+from utils.formatting import format_currency_array, format_percent_array
+
+MONTHLY_CURRENCY_COLUMNS = [
+    "Consumo nominal estimado (COP)",
+    "Consumo real estimado (COP)",
+    "Gasto nominal del mes (COP)",
+    "Gasto real del mes (COP)",
+]
+MONTHLY_PERCENT_COLUMNS = ["Inflación mensual (%)"]
+
+
+def numeric_column_config(currency_columns, percent_columns=(), decimals: int = 2):
+    """
+    column_config para mostrar columnas numéricas con formato sin convertirlas a
+    texto: pesos enteros con "$" y punto de miles ("$17.578.555") y
+    porcentajes. El formato no depende del idioma del navegador ("localized"
+    mostraría "17,578,555.125" en inglés): en el printf del frontend (sprintf-js)
+    "," pide separador de miles y el relleno "'." lo cambia por un punto.
+    """
+    config = {
+        col: st.column_config.NumberColumn(col, format="$%'.,.0f")
+        for col in currency_columns
+    }
+    config.update(
+        {
+            col: st.column_config.NumberColumn(col, format=f"%.{decimals}f%%")
+            for col in percent_columns
+        }
+    )
+    return config
+
+
+def format_frame_for_display(
+    df: pd.DataFrame, currency_columns, percent_columns=(), decimals: int = 2
+) -> pd.DataFrame:
+    """Copia del DataFrame con las columnas indicadas como texto (formato vectorizado)."""
+    df_display = df.copy()
+    for col in currency_columns:
+        df_display[col] = format_currency_array(df[col].to_numpy())
+    for col in percent_columns:
+        df_display[col] = format_percent_array(df[col].to_numpy(), decimals)
+    return df_display
+
+
+def render_monthly_table(
+    df_mensual: pd.DataFrame,
+    result_hash: Optional[str] = None,
+    as_text: bool = False,
+):
     st.subheader("Detalle mes a mes")
     st.markdown(
         """
@@ -13,47 +61,56 @@ def render_monthly_table(df_mensual: pd.DataFrame):
 
         - la inflación que estás suponiendo,
         - el gasto mensual a precios de ese momento,
-        - y el mismo gasto convertido a "pesos de hoy".
+        - el mismo gasto convertido a "pesos de hoy",
+        - y el gasto **acumulado dentro del mes** (nominal y real), que suma
+          exactamente los totales de las tarjetas de arriba.
 
         Úsalo para identificar meses particularmente caros o sensibles a la inflación.
         """
     )
 
-    # ----- Copia SOLO para mostrar, con formato humano -----
-    df_display = df_mensual.copy()
-
-    # Inflación en formato porcentual
-    df_display["Inflación mensual (%)"] = df_display["Inflación mensual (%)"].map(
-        lambda x: format_percent(x, 2)
-    )
-
-    # Columnas en pesos con signo y separadores de miles
-    for col in ["Consumo nominal estimado (COP)", "Consumo real estimado (COP)"]:
-        df_display[col] = df_display[col].map(format_currency)
-
-    st.dataframe(df_display, hide_index=True, use_container_width=True)
+    if as_text:
+        # Copia SOLO para mostrar, con formato humano (texto)
+        df_display = format_frame_for_display(
+            df_mensual, MONTHLY_CURRENCY_COLUMNS, MONTHLY_PERCENT_COLUMNS
+        )
+        st.dataframe(df_display, hide_index=True, use_container_width=True)
+    else:
+        # Sin copia: el formato lo aplica el frontend y el orden sigue siendo numérico
+        st.dataframe(
+            df_mensual,
+            hide_index=True,
+            use_container_width=True,
+            column_config=numeric_column_config(
+                MONTHLY_CURRENCY_COLUMNS, MONTHLY_PERCENT_COLUMNS
+            ),
+        )
 
     # ----- Gráfico de barras: usamos el DataFrame numérico original -----
-    df_plot = df_mensual.set_index("Mes")[
-        [
-            "Consumo nominal estimado (COP)",
-            "Consumo real estimado (COP)",
-        ]
-    ].reset_index()
-
-    fig_bar = px.bar(
-        df_plot,
-        x="Mes",
-        y=["Consumo nominal estimado (COP)", "Consumo real estimado (COP)"],
-        barmode="group",
-        labels={"value": "COP", "variable": "Tipo de consumo"},
-    )
-    fig_bar.update_layout(
-        margin=dict(l=10, r=10, t=40, b=10),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    )
-
-    st.plotly_chart(fig_bar, use_container_width=True)
+    def build_bars():
+        df_plot = df_mensual.set_index("Mes")[
+            [
+                "Consumo nominal estimado (COP)",
+                "Consumo real estimado (COP)",
+            ]
+        ].reset_index()
+
+        fig_bar = px.bar(
+            df_plot,
+            x="Mes",
+            y=["Consumo nominal estimado (COP)", "Consumo real estimado (COP)"],
+            barmode="group",
+            labels={"value": "COP", "variable": "Tipo de consumo"},
+        )
+        fig_bar.update_layout(
+            margin=dict(l=10, r=10, t=40, b=10),
+            legend=dict(
+                orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1
+            ),
+        )
+        return fig_bar
+
+    render_cached_chart("barras_mensual", result_hash, build_bars, df_mensual)
 
 
 def render_annual_summary(df_anual: pd.DataFrame):
@@ -1,6 +1,153 @@
+import numpy as np
+
+
 def format_currency(value: float) -> str:
-    return f"${value:,.0f}".replace(",", ".")
+    sign = "-" if round(value) < 0 else ""
+    return f"{sign}${abs(value):,.0f}".replace(",", ".")
 
 
 def format_percent(value: float, decimals: int = 2) -> str:
     return f"{value:.{decimals}f}%"
+
+
+# Primer valor escalado que no cabe en int64 (2**63, exacto en float64)
+_INT64_LIMIT = float(2**63)
+
+
+def _num_digits(n: np.ndarray) -> np.ndarray:
+    """Cantidad de dígitos decimales de enteros no negativos (0 tiene 1 dígito)."""
+    powers = 10 ** np.arange(1, 19, dtype=np.int64)
+    return 1 + np.searchsorted(powers, n, side="right")
+
+
+def _format_fixed_array(
+    values,
+    decimals: int,
+    thousands_sep: str,
+    decimal_sep: str,
+    prefix: str,
+    suffix: str,
+    signed_zero: bool,
+) -> np.ndarray:
+    """
+    Formatea un arreglo de números a texto con operaciones enteras vectorizadas:
+    se arma una matriz de caracteres (N, ancho) alineada a la derecha, dígito a
+    dígito (≤ 19 pasadas sobre el arreglo completo, sin bucle por celda).
+    Los valores no finitos se muestran como "—". Con signed_zero=True un
+    negativo que redondea a cero conserva el signo ("-0.00%"), como las
+    versiones escalares.
+    """
+    values = np.asarray(values, dtype=float)
+    flat = values.ravel()
+    finite = np.isfinite(flat)
+    if flat.size == 0:
+        return np.empty(values.shape, dtype=str)
+
+    raw = np.abs(np.where(finite, flat, 0.0)) * 10**decimals
+    # Fuera del rango de int64 se formatea con la versión escalar (ver abajo)
+    huge = raw >= _INT64_LIMIT
+    raw[huge] = 0.0
+    scaled = np.rint(raw).astype(np.int64)
+    # Casi-empates (x.5 tras escalar): se redondean como el formateo de Python,
+    # que usa el valor binario exacto; son pocos y se resuelven uno a uno.
+    ties = np.flatnonzero(np.abs(raw - np.floor(raw) - 0.5) < 1e-6)
+    for i in ties:
+        scaled[i] = int(f"{abs(flat[i]):.{decimals}f}".replace(".", ""))
+    negative = np.signbit(flat) & finite
+    if not signed_zero:
+        negative &= scaled > 0
+
+    n_digits = np.maximum(_num_digits(scaled), decimals + 1)
+    int_digits = n_digits - decimals
+    n_seps = (int_digits - 1) // 3 if thousands_sep else np.zeros_like(int_digits)
+    body_width = n_digits + (1 if decimals else 0) + n_seps
+
+    head_width = len(prefix) + 1  # signo + prefijo
+    width = head_width + int(body_width.max()) + len(suffix)
+    buf = np.full((flat.size, width), ord(" "), dtype=np.uint8)
+    right = width - 1 - len(suffix)  # columna del último dígito
+
+    if suffix:
+        buf[:, right + 1 :] = np.frombuffer(suffix.encode("ascii"), dtype=np.uint8)
+
+    rows = np.arange(flat.size)
+    rest = scaled.copy()
+    for p in range(int(n_digits.max())):
+        digit = (rest % 10).astype(np.uint8)
+        rest //= 10
+        active = p < n_digits
+        if p < decimals:
+            offset = p
+        else:
+            q = p - decimals  # índice del dígito entero
+            offset = p + (1 if decimals else 0) + (q // 3 if thousands_sep else 0)
+            if q > 0 and q % 3 == 0 and thousands_sep:
+                buf[active, right - offset + 1] = ord(thousands_sep)
+        buf[active, right - offset] = ord("0") + digit[active]
+    if decimals:
+        buf[:, right - decimals] = ord(decimal_sep)
+
+    # Prefijo y signo justo a la izquierda del número (columna variable por fila)
+    start = right - body_width + 1
+    for i, ch in enumerate(reversed(prefix)):
+        buf[rows, start - 1 - i] = ord(ch)
+    minus_col = start - 1 - len(prefix)
+    buf[rows[negative], minus_col[negative]] = ord("-")
+
+    text = np.char.lstrip(buf.view(f"S{width}").ravel().astype(f"U{width}"))
+    text = np.where(finite, text, "—")
+    if huge.any():
+        big = [
+            _format_fixed_scalar(
+                flat[i], decimals, thousands_sep, decimal_sep, prefix, suffix
+            )
+            for i in np.flatnonzero(huge)
+        ]
+        text = text.astype(f"U{max(width, max(map(len, big)))}")
+        text[huge] = big
+    return text.reshape(values.shape)
+
+
+def _format_fixed_scalar(
+    value: float,
+    decimals: int,
+    thousands_sep: str,
+    decimal_sep: str,
+    prefix: str,
+    suffix: str,
+) -> str:
+    """Mismo formato que _format_fixed_array para un valor (enteros de Python)."""
+    body = f"{abs(value):,.{decimals}f}"
+    body = body.replace(",", "\0").replace(".", decimal_sep)
+    body = body.replace("\0", thousands_sep)
+    sign = "-" if value < 0 else ""
+    return f"{sign}{prefix}{body}{suffix}"
+
+
+def format_currency_array(values) -> np.ndarray:
+    """
+    Versión vectorizada de format_currency para arreglos completos:
+    pesos colombianos con "." como separador de miles ("$1.500.000").
+    """
+    return _format_fixed_array(
+        values,
+        decimals=0,
+        thousands_sep=".",
+        decimal_sep=",",
+        prefix="$",
+        suffix="",
+        signed_zero=False,
+    )
+
+
+def format_percent_array(values, decimals: int = 2) -> np.ndarray:
+    """Versión vectorizada de format_percent ("0.24%")."""
+    return _format_fixed_array(
+        values,
+        decimals=decimals,
+        thousands_sep="",
+        decimal_sep=".",
+        prefix="",
+        suffix="%",
+        signed_zero=True,
+    )
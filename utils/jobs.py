@@ -0,0 +1,183 @@
+"""
+Trabajos en segundo plano para los cálculos pesados de la app (Monte Carlo,
+barridos, corridas de varios años).
+
+Un trabajo corre en un hilo del pool y reporta su avance con job.report(),
+opcionalmente con un resultado parcial (por ejemplo bandas de percentiles que
+van convergiendo). La página solo lee job.snapshot() y no se bloquea.
+
+JobManager guarda un trabajo activo por ranura ("montecarlo", ...): al enviar
+otro con una clave distinta (cambiaron las entradas) el anterior se cancela.
+La cancelación es cooperativa: el siguiente job.report() del trabajo viejo
+lanza JobCancelled y el hilo queda libre. Cuando el JobManager se descarta (por
+ejemplo al cerrarse la sesión de Streamlit que lo guardaba) sus trabajos se
+cancelan, para no ocupar el pool compartido con resultados que nadie leerá.
+
+Se usan hilos y no procesos: NumPy y el kernel Numba (nogil) sueltan el GIL en
+las operaciones pesadas, y los resultados no se copian entre procesos.
+"""
+
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+DEFAULT_JOB_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+
+class JobCancelled(Exception):
+    """Se lanza dentro del trabajo cuando fue cancelado o reemplazado."""
+
+
+class Job:
+    """
+    Estado de un cálculo en segundo plano. La función del trabajo recibe el
+    Job como primer argumento y llama a report() entre bloques.
+    """
+
+    def __init__(self, key: Hashable):
+        self.key = key
+        self.status = "pending"  # pending | running | done | cancelled | error
+        self.progress = 0.0
+        self.partial: Any = None
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    # ----- desde el trabajo -----
+
+    def report(self, progress: float, partial: Any = None) -> None:
+        """Publica el avance (0 a 1) y, si se da, un resultado parcial."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        with self._lock:
+            self.progress = min(max(float(progress), 0.0), 1.0)
+            if partial is not None:
+                self.partial = partial
+
+    # ----- desde la página -----
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que termine (por cualquier motivo); False si venció el plazo."""
+        return self._done.wait(timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copia consistente del estado para mostrarla."""
+        with self._lock:
+            end = self.finished_at or time.perf_counter()
+            return {
+                "status": self.status,
+                "progress": self.progress,
+                "partial": self.partial,
+                "result": self.result,
+                "error": self.error,
+                "elapsed": end - self.started_at if self.started_at else 0.0,
+            }
+
+    def _run(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        with self._lock:
+            if self._cancel.is_set():
+                self.status = "cancelled"
+                self._done.set()
+                return
+            self.status = "running"
+            self.started_at = time.perf_counter()
+        try:
+            result = fn(self, *args, **kwargs)
+        except JobCancelled:
+            status, result, error = "cancelled", None, None
+        except Exception as exc:  # se muestra en la página, no mata el hilo
+            status, result, error = "error", None, exc
+        else:
+            status, error = "done", None
+        with self._lock:
+            self.status = status
+            self.result = result
+            self.error = error
+            if status == "done":
+                self.progress = 1.0
+            self.finished_at = time.perf_counter()
+        self._done.set()
+
+
+class JobManager:
+    """
+    Un trabajo activo por ranura. Se puede compartir el pool de hilos entre
+    varios JobManager (uno por sesión de Streamlit).
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: int = DEFAULT_JOB_WORKERS,
+    ):
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="presupuesto-job"
+        )
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        # Sin referencias a self, para que el manager pueda recolectarse
+        weakref.finalize(self, _cancel_jobs, self._jobs, self._lock)
+
+    def submit(
+        self, slot: str, key: Hashable, fn: Callable[..., Any], *args, **kwargs
+    ) -> Job:
+        """
+        Lanza fn(job, *args, **kwargs) en la ranura. Si ya hay un trabajo con la
+        misma clave (en curso o terminado bien) se devuelve ese; si la clave es
+        otra, el anterior se cancela.
+        """
+        with self._lock:
+            current = self._jobs.get(slot)
+            if (
+                current is not None
+                and current.key == key
+                and current.status not in ("cancelled", "error")
+                and not current.cancelled
+            ):
+                return current
+            if current is not None:
+                current.cancel()
+            job = Job(key)
+            self._jobs[slot] = job
+        self._executor.submit(job._run, fn, args, kwargs)
+        return job
+
+    def get(self, slot: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(slot)
+
+    def cancel(self, slot: str) -> None:
+        """Cancela y olvida el trabajo de la ranura (si hay uno)."""
+        with self._lock:
+            job = self._jobs.pop(slot, None)
+        if job is not None:
+            job.cancel()
+
+    def cancel_all(self) -> None:
+        _cancel_jobs(self._jobs, self._lock)
+
+
+def _cancel_jobs(jobs: Dict[str, Job], lock: threading.Lock) -> None:
+    with lock:
+        pending = list(jobs.values())
+        jobs.clear()
+    for job in pending:
+        job.cancel()
@@ -0,0 +1,381 @@
+"""
+Prueba de carga de la app sin navegador (Streamlit AppTest).
+
+Simula N sesiones que cambian entradas del panel lateral (gasto mensual,
+sliders, escenario de precios, forma de cálculo) y mide, por nivel de
+concurrencia:
+
+- latencia de cada rerun (percentiles p50/p90/p95/p99), aparte de la primera
+  carga de cada sesión,
+- tiempo de CPU por rerun y por sesión, y la capacidad que eso deja: cuántos
+  reruns por segundo aguanta un proceso de Streamlit (1000 / ms de CPU),
+- memoria residente (RSS) que agrega cada sesión viva.
+
+Las sesiones son hilos de un mismo proceso, como en el servidor de Streamlit:
+comparten cachés (st.cache_resource, historial) y memoria. AppTest no es
+seguro entre hilos, así que cada rerun corre bajo un lock; eso modela un
+proceso limitado por el GIL (una cota pesimista: NumPy podría solaparse un
+poco) y la latencia incluye la espera en cola, que es lo que ve el usuario
+cuando el proceso se satura. El CPU de cada rerun se mide dentro del lock y
+se atribuye a su sesión.
+
+    python -m utils.loadtest --sessions 1 2 4 8 --reruns 20 --out carga.json
+    python -m utils.loadtest --sessions 1 4 --compare carga_anterior.json
+
+El reporte JSON incluye el commit, las versiones y la máquina, para comparar
+corridas entre versiones de la app.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+PERCENTILES = (50, 90, 95, 99)
+
+_ALPHA_OPTIONS = (800_000, 1_500_000, 2_400_000, 4_000_000)
+
+# AppTest no es seguro entre hilos: un rerun a la vez (ver docstring)
+_RUN_LOCK = threading.Lock()
+
+
+def _rss_mb() -> float:
+    """Memoria residente actual del proceso en MB (pico si no hay /proc)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _latency_summary(samples_ms: Sequence[float]) -> Dict[str, float]:
+    if not samples_ms:
+        return {}
+    values = np.asarray(samples_ms, dtype=float)
+    out = {
+        f"p{q}": float(v)
+        for q, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))
+    }
+    out["mean"] = float(values.mean())
+    out["max"] = float(values.max())
+    return out
+
+
+def _widget(widgets, label_prefix: str):
+    """Widget de la lista cuyo rótulo empieza con label_prefix."""
+    for w in widgets:
+        if w.label.startswith(label_prefix):
+            return w
+    raise LookupError(f"No se encontró el control «{label_prefix}…».")
+
+
+def random_sidebar_change(at, rng: np.random.Generator) -> str:
+    """Aplica un cambio aleatorio en el panel lateral (sin ejecutar el rerun)."""
+    sidebar = at.sidebar
+    action = rng.integers(5)
+    if action == 0:
+        alpha = int(rng.choice(_ALPHA_OPTIONS))
+        sidebar.text_input(key="alpha_input").set_value(
+            f"$ {alpha:,}".replace(",", ".")
+        )
+        return "gasto mensual"
+    if action == 1:
+        _widget(sidebar.slider, "¿Qué tanta diferencia").set_value(
+            int(rng.integers(0, 51))
+        )
+        return "variación"
+    if action == 2:
+        _widget(sidebar.slider, "¿Cuánto pesan").set_value(int(rng.integers(0, 31)))
+        return "estacionalidad"
+    if action == 3:
+        radio = sidebar.radio[0]
+        radio.set_value(str(rng.choice(radio.options)))
+        return "escenario"
+    select = sidebar.selectbox[0]
+    select.set_value(str(rng.choice(select.options)))
+    return "forma de cálculo"
+
+
+def run_session(
+    session_id: int,
+    reruns: int,
+    seed: int,
+    think_s: float,
+    timeout: float,
+    sessions_out: list,
+) -> Dict[str, Any]:
+    """
+    Una sesión: primera carga y luego `reruns` cambios del panel lateral. La
+    AppTest se deja en sessions_out para que siga viva al medir la memoria.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = np.random.default_rng([seed, session_id])
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    sessions_out.append(at)
+    errors: List[str] = []
+
+    def timed_run():
+        start = time.perf_counter()
+        with _RUN_LOCK:
+            cpu_start = time.process_time()
+            at.run()
+            cpu_ms.append((time.process_time() - cpu_start) * 1e3)
+        if at.exception:
+            errors.append(at.exception[0].message)
+        return (time.perf_counter() - start) * 1e3
+
+    cpu_ms: List[float] = []
+    first_ms = timed_run()
+    rerun_ms = []
+    for _ in range(reruns):
+        if think_s > 0:
+            time.sleep(think_s)
+        try:
+            random_sidebar_change(at, rng)
+        except (LookupError, IndexError) as exc:
+            errors.append(f"No se pudo cambiar el panel lateral: {exc}")
+            continue
+        rerun_ms.append(timed_run())
+    return {
+        "first_ms": first_ms,
+        "rerun_ms": rerun_ms,
+        "cpu_ms": cpu_ms,
+        "errors": errors,
+    }
+
+
+def run_level(
+    n_sessions: int,
+    reruns: int,
+    seed: int = 0,
+    think_s: float = 0.0,
+    timeout: float = 120.0,
+) -> Dict[str, Any]:
+    """Corre n_sessions sesiones concurrentes y resume latencia, CPU y memoria."""
+    gc.collect()
+    rss_before = _rss_mb()
+    sessions: list = []
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n_sessions) as pool:
+        results = list(
+            pool.map(
+                lambda i: run_session(i, reruns, seed, think_s, timeout, sessions),
+                range(n_sessions),
+            )
+        )
+    wall_s = time.perf_counter() - wall_start
+    rss_after = _rss_mb()
+    del sessions
+    gc.collect()
+
+    first = [r["first_ms"] for r in results]
+    rerun = [ms for r in results for ms in r["rerun_ms"]]
+    cpu = [ms for r in results for ms in r["cpu_ms"]]
+    cpu_s = sum(cpu) / 1e3
+    errors = [e for r in results for e in r["errors"]]
+    cpu_ms_per_run = float(np.mean(cpu)) if cpu else 0.0
+    return {
+        "sessions": n_sessions,
+        "runs": len(cpu),
+        "wall_s": wall_s,
+        "throughput_runs_per_s": len(cpu) / wall_s if wall_s > 0 else 0.0,
+        "latency_ms": {
+            "first": _latency_summary(first),
+            "rerun": _latency_summary(rerun),
+        },
+        "cpu_ms_per_run": cpu_ms_per_run,
+        "cpu_ms_per_run_pct": _latency_summary(cpu),
+        "cpu_s_per_session": cpu_s / n_sessions,
+        "cpu_busy": cpu_s / wall_s if wall_s > 0 else 0.0,
+        "capacity_runs_per_s": 1e3 / cpu_ms_per_run if cpu_ms_per_run else 0.0,
+        "rss_mb_per_session": max(rss_after - rss_before, 0.0) / n_sessions,
+        "rss_mb_after": rss_after,
+        "errors": sorted(set(errors)),
+        "n_errors": len(errors),
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """Versión de la app y de la máquina, para comparar reportes."""
+    import streamlit
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def load_test(
+    sessions: Sequence[int],
+    reruns: int = 20,
+    seed: int = 0,
+    think_s: float = 0.0,
+    timeout: float = 120.0,
+    store_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Corre un nivel por cada cantidad de sesiones. El historial se escribe en
+    store_path (por defecto un archivo temporal, para no tocar runs.sqlite).
+    Un calentamiento previo deja cargados los módulos y las cachés del proceso.
+    """
+    from streamlit import logger
+
+    os.environ["PRESUPUESTO_STORE"] = store_path or os.path.join(
+        tempfile.mkdtemp(prefix="presupuesto-carga-"), "runs.sqlite"
+    )
+    run_session(0, 1, seed, 0.0, timeout, [])  # calentamiento (no se reporta)
+    # Sin los avisos de Streamlit en cada rerun (la config ya quedó cargada)
+    logger.set_log_level("error")
+
+    levels = []
+    for n in sessions:
+        level = run_level(n, reruns, seed, think_s, timeout)
+        levels.append(level)
+        print(_format_level(level), file=sys.stderr)
+    return {
+        "environment": environment_info(),
+        "params": {
+            "sessions": list(sessions),
+            "reruns": reruns,
+            "seed": seed,
+            "think_s": think_s,
+        },
+        "levels": levels,
+    }
+
+
+# ----- salida por consola -----
+
+_HEADER = (
+    f"{'Sesiones':>8}  {'Reruns/s':>8}  {'p50 (ms)':>9}  {'p95 (ms)':>9}  "
+    f"{'p99 (ms)':>9}  {'CPU/rerun (ms)':>14}  {'Uso CPU':>7}  "
+    f"{'Capacidad':>9}  {'MB/sesión':>9}"
+)
+
+
+def _format_level(level: Dict[str, Any]) -> str:
+    lat = level["latency_ms"]["rerun"] or level["latency_ms"]["first"]
+    line = (
+        f"{level['sessions']:>8}  {level['throughput_runs_per_s']:>8.1f}  "
+        f"{lat['p50']:>9.1f}  {lat['p95']:>9.1f}  {lat['p99']:>9.1f}  "
+        f"{level['cpu_ms_per_run']:>14.1f}  {level['cpu_busy']:>7.0%}  "
+        f"{level['capacity_runs_per_s']:>9.1f}  {level['rss_mb_per_session']:>9.1f}"
+    )
+    if level["n_errors"]:
+        line += f"  ({level['n_errors']} errores)"
+    return line
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    env = report["environment"]
+    print(
+        f"Commit {env['commit'] or '¿?'} · Python {env['python']} · "
+        f"Streamlit {env['streamlit']} · {env['cpus']} CPUs"
+    )
+    print(_HEADER)
+    for level in report["levels"]:
+        print(_format_level(level))
+    print("Capacidad = reruns/s que aguanta un proceso (1000 / ms de CPU por rerun).")
+    for level in report["levels"]:
+        for err in level["errors"]:
+            print(f"[{level['sessions']} sesiones] {err}")
+
+
+def compare_reports(base: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Cambio relativo (%) de las métricas clave por nivel presente en ambos."""
+    base_levels = {lvl["sessions"]: lvl for lvl in base["levels"]}
+    rows = []
+    for lvl in new["levels"]:
+        old = base_levels.get(lvl["sessions"])
+        if old is None:
+            continue
+        row = {"Sesiones": lvl["sessions"]}
+        for label, get in (
+            ("p50 rerun", lambda x: x["latency_ms"]["rerun"].get("p50")),
+            ("p95 rerun", lambda x: x["latency_ms"]["rerun"].get("p95")),
+            ("CPU/rerun", lambda x: x["cpu_ms_per_run"]),
+            ("Capacidad", lambda x: x["capacity_runs_per_s"]),
+            ("MB/sesión", lambda x: x["rss_mb_per_session"]),
+        ):
+            a, b = get(old), get(lvl)
+            row[label] = (b - a) / a * 100.0 if a and b is not None else None
+        rows.append(row)
+    return rows
+
+
+def print_comparison(base: Dict[str, Any], new: Dict[str, Any]) -> None:
+    rows = compare_reports(base, new)
+    print(
+        f"\nFrente a {base['environment'].get('commit') or 'el reporte base'} "
+        "(cambio %, negativo = menos):"
+    )
+    if not rows:
+        print("No hay niveles de sesiones en común.")
+        return
+    labels = [k for k in rows[0] if k != "Sesiones"]
+    print(f"{'Sesiones':>8}  " + "  ".join(f"{k:>10}" for k in labels))
+    for row in rows:
+        cells = [
+            f"{row[k]:>+9.1f}%" if row[k] is not None else f"{'—':>10}" for k in labels
+        ]
+        print(f"{row['Sesiones']:>8}  " + "  ".join(cells))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba de carga de la app.")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--reruns", type=int, default=20, help="cambios por sesión")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--think", type=float, default=0.0, help="pausa entre cambios (s)"
+    )
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--store", help="archivo SQLite del historial")
+    parser.add_argument("--out", help="guarda el reporte JSON en este archivo")
+    parser.add_argument("--compare", help="reporte JSON anterior para comparar")
+    args = parser.parse_args(argv)
+
+    report = load_test(
+        args.sessions, args.reruns, args.seed, args.think, args.timeout, args.store
+    )
+    print_report(report)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Estado por sesión de Streamlit que sobrevive entre reruns.
+"""
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+import streamlit as st
+
+from core.analytics import ScenarioConfig
+from core.incremental import IncrementalScenario
+from utils.jobs import DEFAULT_JOB_WORKERS, JobManager
+
+_INCREMENTAL_KEY = "_incremental_scenario"
+_JOBS_KEY = "_job_manager"
+_OWNER_KEY = "_run_owner"
+
+
+def config_key(config: ScenarioConfig, with_inflation: bool = False) -> Tuple:
+    """Clave comparable de las entradas de un escenario (sin o con la inflación)."""
+    c = config.consumption
+    key = (
+        float(c.alpha),
+        float(c.beta),
+        float(c.gamma),
+        float(config.inflation_factor),
+        config.method,
+        config.precision,
+    )
+    if with_inflation:
+        key += tuple(float(p) for p in config.inflation_percent)
+    return key
+
+
+def get_incremental_scenario(config: ScenarioConfig) -> IncrementalScenario:
+    """
+    Escenario incremental de la sesión al día con `config`. Si solo cambió la
+    tabla de inflación se editan los meses afectados; si cambió el consumo, κ,
+    el método o la precisión se arma uno nuevo.
+    """
+    key = config_key(config)
+    entry = st.session_state.get(_INCREMENTAL_KEY)
+    if entry is None or entry[0] != key:
+        scenario = IncrementalScenario(config)
+        st.session_state[_INCREMENTAL_KEY] = (key, scenario)
+        return scenario
+    scenario = entry[1]
+    scenario.update(config.inflation_percent)
+    return scenario
+
+
+@st.cache_resource(show_spinner=False)
+def _job_executor() -> ThreadPoolExecutor:
+    """Pool de hilos compartido por todas las sesiones."""
+    return ThreadPoolExecutor(
+        max_workers=DEFAULT_JOB_WORKERS, thread_name_prefix="presupuesto-job"
+    )
+
+
+def get_job_manager() -> JobManager:
+    """Trabajos en segundo plano de la sesión (un trabajo activo por ranura)."""
+    manager = st.session_state.get(_JOBS_KEY)
+    if manager is None:
+        manager = JobManager(_job_executor())
+        st.session_state[_JOBS_KEY] = manager
+    return manager
+
+
+def get_session_owner() -> str:
+    """Id aleatorio de la sesión; dueño de las corridas que guarda en el historial."""
+    owner = st.session_state.get(_OWNER_KEY)
+    if owner is None:
+        owner = uuid.uuid4().hex
+        st.session_state[_OWNER_KEY] = owner
+    return owner
@@ -0,0 +1,158 @@
+"""
+Arranque rápido de la app: precarga en segundo plano de módulos pesados y un
+modo de medición del tiempo de arranque.
+
+- En la app: con la variable de entorno PRESUPUESTO_PROFILE=1 (o ?profile=1 en
+  la URL) se muestra, al final de la página, el tiempo de cada etapa del rerun
+  y el costo de cada import diferido.
+- Por consola: `python -m utils.startup` mide en procesos limpios el costo de
+  importar cada módulo (python -X importtime) y lo reporta ordenado.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence
+
+PROFILE_ENV_VAR = "PRESUPUESTO_PROFILE"
+
+# Módulos que la app solo necesita después del primer contenido visible
+HEAVY_MODULES = ("pandas", "plotly.express")
+
+DEFAULT_REPORT_MODULES = (
+    "streamlit",
+    "numpy",
+    "pandas",
+    "plotly.express",
+    "core.analytics",
+    "ui.sidebar",
+    "ui.charts",
+    "ui.tables",
+    "ui.comparison",
+    "ui.montecarlo",
+    "ui.diagnostics",
+    "app",
+)
+
+_preload_started = set()
+_preload_lock = threading.Lock()
+
+
+def preload_in_background(modules: Iterable[str] = HEAVY_MODULES) -> None:
+    """
+    Importa los módulos en un hilo daemon (una sola vez por proceso). Si el hilo
+    principal los necesita antes, el lock de imports de Python lo hace esperar.
+    """
+    with _preload_lock:
+        pending = [m for m in modules if m not in _preload_started]
+        if not pending or all(m in sys.modules for m in pending):
+            return
+        _preload_started.update(pending)
+
+    def _run():
+        for name in pending:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass  # el import real en el hilo principal mostrará el error
+
+    threading.Thread(target=_run, name="preload-imports", daemon=True).start()
+
+
+class StartupProfile:
+    """Marca tiempos por etapa desde t0 (inicio del script) y mide imports."""
+
+    def __init__(self, t0: float, enabled: bool):
+        self.t0 = t0
+        self.enabled = enabled
+        self.marks: List[Dict[str, float]] = []
+
+    @classmethod
+    def from_env(cls, t0: float, query_params=None) -> "StartupProfile":
+        enabled = os.environ.get(PROFILE_ENV_VAR, "") == "1"
+        if query_params is not None and query_params.get("profile") == "1":
+            enabled = True
+        return cls(t0, enabled)
+
+    def mark(self, label: str) -> None:
+        if self.enabled:
+            self.marks.append({"Etapa": label, "Desde inicio (ms)": self._elapsed_ms()})
+
+    @contextmanager
+    def stage(self, label: str):
+        """Mide la duración de un bloque (p. ej. un import diferido)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.marks.append(
+                    {
+                        "Etapa": label,
+                        "Desde inicio (ms)": self._elapsed_ms(),
+                        "Duración (ms)": (time.perf_counter() - start) * 1e3,
+                    }
+                )
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1e3
+
+    def render(self) -> None:
+        if not self.enabled:
+            return
+        import streamlit as st
+
+        with st.expander("⏱️ Tiempos de arranque (modo medición)", expanded=True):
+            st.dataframe(self.marks, hide_index=True, use_container_width=True)
+
+
+def measure_import_cost(module: str, python: Optional[str] = None) -> Dict[str, float]:
+    """
+    Costo de importar `module` en un proceso limpio, según python -X importtime.
+    Devuelve tiempo propio y acumulado en ms (incluye sus dependencias).
+    """
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    if proc.returncode != 0:
+        raise ImportError(f"No se pudo importar {module}:\n{proc.stderr[-500:]}")
+    for line in reversed(proc.stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return {
+                "Módulo": module,
+                "Propio (ms)": int(self_us) / 1e3,
+                "Acumulado (ms)": int(cumulative_us) / 1e3,
+            }
+    raise RuntimeError(f"No se encontró {module} en la salida de importtime.")
+
+
+def import_cost_report(modules: Sequence[str] = DEFAULT_REPORT_MODULES) -> List[Dict]:
+    """Costo de import de cada módulo (cada uno en un proceso limpio)."""
+    rows = [measure_import_cost(m) for m in modules]
+    return sorted(rows, key=lambda r: r["Acumulado (ms)"], reverse=True)
+
+
+def main(argv=None):
+    modules = (argv if argv is not None else sys.argv[1:]) or DEFAULT_REPORT_MODULES
+    rows = import_cost_report(modules)
+    width = max(len(r["Módulo"]) for r in rows)
+    print(f"{'Módulo':<{width}}  {'Propio (ms)':>12}  {'Acumulado (ms)':>15}")
+    for r in rows:
+        print(
+            f"{r['Módulo']:<{width}}  {r['Propio (ms)']:>12.1f}  "
+            f"{r['Acumulado (ms)']:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()